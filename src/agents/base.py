@@ -1,14 +1,14 @@
 """Base agent class for Morning Stock Screener agents."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
-from pathlib import Path
-import json
 import logging
+from abc import ABC, abstractmethod
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
 from ..llm import OpenAIWrapper
 from ..models.llm import LLMRequest, LLMResponse
+from ..utils import dump_json
 
 
 class BaseAgent(ABC):
@@ -18,7 +18,7 @@ class BaseAgent(ABC):
     Each agent is stateless and receives context as input, producing structured output.
     """
 
-    def __init__(self, name: str, llm_wrapper: OpenAIWrapper, output_dir: Optional[Path] = None):
+    def __init__(self, name: str, llm_wrapper: OpenAIWrapper, output_dir: Path | None = None):
         """Initialize the base agent.
         
         Args:
@@ -35,7 +35,7 @@ class BaseAgent(ABC):
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     @abstractmethod
-    async def execute(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute(self, context: dict[str, Any]) -> dict[str, Any]:
         """Execute the agent's main logic.
         
         Args:
@@ -47,7 +47,7 @@ class BaseAgent(ABC):
         pass
 
     @abstractmethod
-    def validate_input(self, context: Dict[str, Any]) -> bool:
+    def validate_input(self, context: dict[str, Any]) -> bool:
         """Validate the input context for this agent.
         
         Args:
@@ -59,7 +59,7 @@ class BaseAgent(ABC):
         pass
 
     @abstractmethod
-    def process_output(self, raw_output: Any) -> Dict[str, Any]:
+    def process_output(self, raw_output: Any) -> dict[str, Any]:
         """Process and structure the raw output from the agent.
         
         Args:
@@ -97,7 +97,7 @@ class BaseAgent(ABC):
         
         return await self.llm_wrapper.generate_response(request)
 
-    def save_raw_output(self, output: Any, stage: str, timestamp: Optional[datetime] = None) -> Path:
+    def save_raw_output(self, output: Any, stage: str, timestamp: datetime | None = None) -> Path:
         """Save raw output to the output directory for analysis.
         
         Args:
@@ -119,27 +119,16 @@ class BaseAgent(ABC):
         filename = f"{self.name}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         output_path = stage_dir / filename
         
-        # Save output as JSON
+        # Save output as JSON; orjson encodes straight to UTF-8 bytes
         try:
-            if isinstance(output, dict):
-                # Add metadata
-                output_with_metadata = {
-                    "agent": self.name,
-                    "timestamp": timestamp.isoformat(),
-                    "stage": stage,
-                    "data": output
-                }
-            else:
-                # Wrap non-dict output
-                output_with_metadata = {
-                    "agent": self.name,
-                    "timestamp": timestamp.isoformat(),
-                    "stage": stage,
-                    "data": str(output)
-                }
-                
-            with open(output_path, 'w') as f:
-                json.dump(output_with_metadata, f, indent=2, default=str)
+            payload = {
+                "agent": self.name,
+                "timestamp": timestamp.isoformat(),
+                "stage": stage,
+                # Wrap non-dict output as a string
+                "data": output if isinstance(output, dict) else str(output)
+            }
+            output_path.write_bytes(dump_json(payload))
                 
             self.logger.info(f"Saved raw output to {output_path}")
             return output_path
@@ -148,7 +137,7 @@ class BaseAgent(ABC):
             self.logger.error(f"Failed to save output: {e}")
             raise
 
-    def log_execution_start(self, context: Dict[str, Any]):
+    def log_execution_start(self, context: dict[str, Any]):
         """Log the start of agent execution.
         
         Args:
@@ -157,7 +146,7 @@ class BaseAgent(ABC):
         self.logger.info(f"Starting {self.name} execution")
         self.logger.debug(f"Input context keys: {list(context.keys())}")
 
-    def log_execution_complete(self, output: Dict[str, Any]):
+    def log_execution_complete(self, output: dict[str, Any]):
         """Log the completion of agent execution.
         
         Args:
@@ -166,7 +155,7 @@ class BaseAgent(ABC):
         self.logger.info(f"Completed {self.name} execution")
         self.logger.debug(f"Output keys: {list(output.keys())}")
 
-    async def run(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    async def run(self, context: dict[str, Any]) -> dict[str, Any]:
         """Main entry point to run the agent with full logging and error handling.
         
         Args:
@@ -1,7 +1,6 @@
 """Base abstract class for LLM wrappers."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
 
 from ..models.llm import LLMRequest, LLMResponse
 
@@ -37,7 +36,7 @@ class BaseLLMWrapper(ABC):
         messages: list,
         temperature: float = 0.7,
         max_tokens: int = 4000,
-        model: Optional[str] = None,
+        model: str | None = None,
     ) -> LLMResponse:
         """Generate a response from a chat conversation.
 
@@ -63,8 +62,6 @@ class BaseLLMWrapper(ABC):
         """
         if not request.system_prompt or not request.user_prompt:
             return False
-        if request.temperature < 0 or request.temperature > 2:
-            return False
-        if request.max_tokens <= 0:
-            return False
-        return True
+        # LLMRequest only enforces its field bounds at construction, so requests
+        # mutated afterwards are checked again here
+        return 0 <= request.temperature <= 2 and request.max_tokens > 0
@@ -1,7 +1,12 @@
 """OpenAI API wrapper implementation."""
 
+import hashlib
+import json
+import math
+import operator
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Any
 
 from openai import AsyncOpenAI
 
@@ -12,15 +17,40 @@ from .base import BaseLLMWrapper
 class OpenAIWrapper(BaseLLMWrapper):
     """OpenAI API wrapper implementation."""
 
-    def __init__(self, api_key: str, model: str = "gpt-5"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-5",
+        *,
+        client: AsyncOpenAI | None = None,
+    ):
         """Initialize OpenAI wrapper.
 
         Args:
             api_key: OpenAI API key
             model: Default model to use
+            client: Pre-built client to use instead of creating one
         """
         super().__init__(api_key, model)
-        self.client = AsyncOpenAI(api_key=api_key)
+        self.client = client if client is not None else AsyncOpenAI(api_key=api_key)
+
+        # In-memory TTL cache of successful responses keyed by a hash of the
+        # request. Only near-deterministic requests are cached: sampling at a
+        # higher temperature is meant to vary between identical calls.
+        self.cache_ttl_seconds = 3600.0
+        self.cache_maxsize = 256
+        self.cache_max_temperature = 0.1
+        self._cache: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+
+        # Optional semantic layer: on an exact miss, reuse a cached response whose
+        # user prompt embedding is at least this cosine-similar. Off by default,
+        # since it costs an embedding call per miss and near-identical prompts
+        # can still ask for different things (e.g. different tickers).
+        self.semantic_cache_threshold: float | None = None
+        self.embedding_model = "text-embedding-3-small"
+        self._semantic_cache: (
+            OrderedDict[str, tuple[float, str, tuple[float, ...], LLMResponse]]
+        ) = OrderedDict()
 
     async def generate_response(self, request: LLMRequest) -> LLMResponse:
         """Generate a response using OpenAI API.
@@ -44,6 +74,37 @@ class OpenAIWrapper(BaseLLMWrapper):
 
         start_time = time.time()
 
+        cache_key = None
+        if self._is_cacheable(request.model, request.temperature):
+            cache_key = self._cache_key(
+                request.model,
+                request.system_prompt,
+                request.user_prompt,
+                request.temperature,
+                request.max_tokens,
+                request.additional_params,
+            )
+            cached = self._cache_get(cache_key, start_time)
+            if cached is not None:
+                return cached
+
+        # Everything except the user prompt must match for a semantic hit
+        semantic_scope = None
+        embedding = None
+        if cache_key is not None and self.semantic_cache_threshold is not None:
+            semantic_scope = self._cache_key(
+                request.model,
+                request.system_prompt,
+                request.temperature,
+                request.max_tokens,
+                request.additional_params,
+            )
+            embedding = await self._embed(request.user_prompt)
+            if embedding is not None:
+                cached = self._semantic_cache_get(semantic_scope, embedding, start_time)
+                if cached is not None:
+                    return cached
+
         try:
             # Combine system and user prompts
             messages = [
@@ -80,7 +141,7 @@ class OpenAIWrapper(BaseLLMWrapper):
 
             # Some models may return empty content if the response was structured; ensure we coerce to text
             content_text = getattr(response.choices[0].message, "content", "") or ""
-            return LLMResponse(
+            result = LLMResponse(
                 content=content_text,
                 model_used=response.model,
                 tokens_used=response.usage.total_tokens,
@@ -88,6 +149,11 @@ class OpenAIWrapper(BaseLLMWrapper):
                 response_time_ms=response_time,
                 success=True,
             )
+            if cache_key is not None:
+                self._cache_set(cache_key, result)
+                if semantic_scope is not None and embedding is not None:
+                    self._semantic_cache_set(cache_key, semantic_scope, embedding, result)
+            return result
 
         except Exception as e:
             response_time = (time.time() - start_time) * 1000
@@ -103,10 +169,10 @@ class OpenAIWrapper(BaseLLMWrapper):
 
     async def generate_chat_response(
         self,
-        messages: List[dict],
+        messages: list[dict],
         temperature: float = 0.7,
         max_tokens: int = 4000,
-        model: Optional[str] = None,
+        model: str | None = None,
     ) -> LLMResponse:
         """Generate a response from a chat conversation.
 
@@ -122,6 +188,13 @@ class OpenAIWrapper(BaseLLMWrapper):
         model_to_use = model or self.default_model
         start_time = time.time()
 
+        cache_key = None
+        if self._is_cacheable(model_to_use, temperature):
+            cache_key = self._cache_key(model_to_use, messages, temperature, max_tokens)
+            cached = self._cache_get(cache_key, start_time)
+            if cached is not None:
+                return cached
+
         try:
             # GPT-5 has different API parameters
             if model_to_use.startswith("gpt-5"):
@@ -149,7 +222,7 @@ class OpenAIWrapper(BaseLLMWrapper):
             response_time = (time.time() - start_time) * 1000
 
             content_text = getattr(response.choices[0].message, "content", "") or ""
-            return LLMResponse(
+            result = LLMResponse(
                 content=content_text,
                 model_used=response.model,
                 tokens_used=response.usage.total_tokens,
@@ -157,6 +230,9 @@ class OpenAIWrapper(BaseLLMWrapper):
                 response_time_ms=response_time,
                 success=True,
             )
+            if cache_key is not None:
+                self._cache_set(cache_key, result)
+            return result
 
         except Exception as e:
             response_time = (time.time() - start_time) * 1000
@@ -169,3 +245,158 @@ class OpenAIWrapper(BaseLLMWrapper):
                 success=False,
                 error_message=str(e),
             )
+
+    def _is_cacheable(self, model: str, temperature: float) -> bool:
+        """Check whether a request samples deterministically enough to cache.
+
+        Args:
+            model: Model the request will use
+            temperature: Requested sampling temperature
+
+        Returns:
+            True if responses for this request may be cached
+        """
+        # GPT-5 ignores custom temperatures and always samples at 1
+        effective_temperature = 1.0 if model.startswith("gpt-5") else temperature
+        return effective_temperature <= self.cache_max_temperature
+
+    @staticmethod
+    def _cache_key(*parts: Any) -> str:
+        """Build a cache key from the request parts.
+
+        Args:
+            *parts: Model, prompts or messages, and sampling parameters
+
+        Returns:
+            SHA-256 hex digest of the canonical JSON encoding of the parts
+        """
+        canonical = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: str, start_time: float) -> LLMResponse | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key for the request
+            start_time: When the request started, for the reported response time
+
+        Returns:
+            Copy of the cached response marked with cache_hit, or None if the
+            key is missing or expired
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        expires_at, response = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return self._as_cache_hit(response, start_time)
+
+    def _cache_set(self, key: str, response: LLMResponse) -> None:
+        """Store a successful response, evicting the oldest entry when full.
+
+        Args:
+            key: Cache key for the request
+            response: Successful response to cache
+        """
+        self._cache[key] = (time.monotonic() + self.cache_ttl_seconds, response)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_maxsize:
+            self._cache.popitem(last=False)
+
+    async def _embed(self, text: str) -> tuple[float, ...] | None:
+        """Embed a prompt for the semantic cache.
+
+        Args:
+            text: Prompt to embed
+
+        Returns:
+            Unit-length embedding, or None if the embedding call failed
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=self.embedding_model, input=text
+            )
+        except Exception:
+            # The semantic cache is best-effort; fall through to generation
+            return None
+
+        vector = response.data[0].embedding
+        norm = math.sqrt(sum(value * value for value in vector))
+        if not norm:
+            return None
+        return tuple(value / norm for value in vector)
+
+    def _semantic_cache_get(
+        self, scope: str, embedding: tuple[float, ...], start_time: float
+    ) -> LLMResponse | None:
+        """Find the most similar cached response within the same request scope.
+
+        Args:
+            scope: Cache key of the request parameters other than the user prompt
+            embedding: Unit-length embedding of the user prompt
+            start_time: When the request started, for the reported response time
+
+        Returns:
+            Copy of the best match at or above the similarity threshold marked
+            with cache_hit, or None if there is no such match
+        """
+        now = time.monotonic()
+        best_key = None
+        best_score = self.semantic_cache_threshold
+        for key, (expires_at, entry_scope, entry_embedding, _) in self._semantic_cache.items():
+            if entry_scope != scope or now >= expires_at:
+                continue
+            # Both vectors are unit length, so the dot product is the cosine
+            score = sum(map(operator.mul, embedding, entry_embedding))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+
+        self._semantic_cache.move_to_end(best_key)
+        return self._as_cache_hit(self._semantic_cache[best_key][3], start_time)
+
+    def _semantic_cache_set(
+        self,
+        key: str,
+        scope: str,
+        embedding: tuple[float, ...],
+        response: LLMResponse,
+    ) -> None:
+        """Store a response with its prompt embedding, evicting the oldest when full.
+
+        Args:
+            key: Exact cache key for the request
+            scope: Cache key of the request parameters other than the user prompt
+            embedding: Unit-length embedding of the user prompt
+            response: Successful response to cache
+        """
+        expires_at = time.monotonic() + self.cache_ttl_seconds
+        self._semantic_cache[key] = (expires_at, scope, embedding, response)
+        self._semantic_cache.move_to_end(key)
+        while len(self._semantic_cache) > self.cache_maxsize:
+            self._semantic_cache.popitem(last=False)
+
+    @staticmethod
+    def _as_cache_hit(response: LLMResponse, start_time: float) -> LLMResponse:
+        """Copy a cached response for return to the caller.
+
+        Args:
+            response: Cached response
+            start_time: When the request started, for the reported response time
+
+        Returns:
+            Copy of the response marked with cache_hit
+        """
+        return response.model_copy(
+            update={
+                "response_time_ms": (time.time() - start_time) * 1000,
+                "cache_hit": True,
+            }
+        )
@@ -1,6 +1,6 @@
 """LLM request and response data models."""
 
-from typing import Any, Dict, Optional
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -17,7 +17,7 @@ class LLMRequest(BaseModel):
         default=4000, gt=0, description="Maximum tokens in response"
     )
     model: str = Field(default="gpt-5", description="LLM model to use")
-    additional_params: Dict[str, Any] = Field(
+    additional_params: dict[str, Any] = Field(
         default_factory=dict, description="Additional model parameters"
     )
 
@@ -33,8 +33,11 @@ class LLMResponse(BaseModel):
     )
     response_time_ms: float = Field(..., description="Response time in milliseconds")
     success: bool = Field(..., description="Whether the request was successful")
-    error_message: Optional[str] = Field(
+    error_message: str | None = Field(
         default=None, description="Error message if request failed"
     )
+    cache_hit: bool = Field(
+        default=False, description="Whether the response was served from cache"
+    )
 
     model_config = {"json_encoders": {float: lambda v: round(v, 2) if v else v}}
@@ -1,10 +1,24 @@
 """Stock-related data models."""
 
 from datetime import datetime, timezone
-from decimal import Decimal
-from typing import List
+from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    NonNegativeFloat,
+    StringConstraints,
+)
+
+
+def _utc_now() -> datetime:
+    """Current UTC time."""
+    return datetime.now(timezone.utc)
+
+
+# Stock ticker symbol: 1-6 letters, normalised to upper case
+Symbol = Annotated[str, StringConstraints(pattern=r"^[A-Za-z]{1,6}$", to_upper=True)]
 
 
 class StockAnalysis(BaseModel):
@@ -23,8 +37,7 @@ class StockAnalysis(BaseModel):
         ..., description="Sudden news, innovative products, regulatory approvals"
     )
 
-    class Config:
-        json_encoders = {Decimal: str}
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
 
 class StockRecommendation(BaseModel):
@@ -36,50 +49,36 @@ class StockRecommendation(BaseModel):
     long_term_reasoning: str = Field(
         ..., description="Why this is a good long-term investment"
     )
-    risk_factors: List[str] = Field(
+    risk_factors: list[str] = Field(
         default_factory=list, description="Key risk factors to consider"
     )
     confidence_score: float = Field(
         ..., ge=0.0, le=1.0, description="Confidence score from 0-1"
     )
 
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
 
 class Stock(BaseModel):
     """Stock information and analysis."""
 
     name: str = Field(..., description="Company name")
-    symbol: str = Field(..., description="Stock ticker symbol")
-    price: Decimal = Field(..., description="Current stock price")
-    change: Decimal = Field(..., description="Price change from previous close")
-    change_percentage: Decimal = Field(
+    symbol: Symbol = Field(..., description="Stock ticker symbol")
+    price: NonNegativeFloat = Field(..., description="Current stock price")
+    change: float = Field(..., description="Price change from previous close")
+    change_percentage: float = Field(
         ..., description="Percentage change from previous close"
     )
     volume: int = Field(..., description="Trading volume")
-    market_cap: Decimal = Field(..., description="Market capitalization")
+    market_cap: NonNegativeFloat = Field(..., description="Market capitalization")
     industry: str = Field(..., description="Industry sector")
     analysis: StockAnalysis = Field(..., description="Detailed stock analysis")
     recommendation: StockRecommendation = Field(
         ..., description="Investment recommendation"
     )
     last_updated: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=_utc_now,
         description="Last update timestamp",
     )
 
-    @field_validator("symbol")
-    @classmethod
-    def validate_symbol(cls, v):
-        """Validate stock symbol format."""
-        if not v.isalpha():
-            raise ValueError("Stock symbol must contain only letters")
-        return v.upper()
-
-    @field_validator("price", "change", "change_percentage", "market_cap")
-    @classmethod
-    def validate_decimal_fields(cls, v):
-        """Ensure decimal fields are positive where appropriate."""
-        if v < 0 and cls.__name__ in ["price", "market_cap"]:
-            raise ValueError(f"{cls.__name__} cannot be negative")
-        return v
-
-    model_config = {"json_encoders": {Decimal: str, datetime: lambda v: v.isoformat()}}
+    model_config = ConfigDict(frozen=True, extra="ignore")
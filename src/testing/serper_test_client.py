@@ -7,14 +7,99 @@ the Google Serper tool's functionality and see real results in action.
 """
 
 import asyncio
-import json
+import logging
 import os
-from datetime import datetime
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Any
+
+import orjson
 
-from src.tools.google_serper import GoogleSerperTool
 from src.config.settings import get_settings
+from src.tools.google_serper import GoogleSerperTool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class QuerySpec:
+    """A broad test query and the source categories it should hit."""
+
+    name: str
+    query: str
+    category: str
+    expected_sources: tuple[str, ...]
+    expected_sources_str: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Join expected sources once for log output."""
+        object.__setattr__(self, "expected_sources_str", ", ".join(self.expected_sources))
+
+
+# 10 broad test queries covering different aspects, built once at import
+_TEST_QUERIES: tuple[QuerySpec, ...] = (
+    QuerySpec(
+        name="macroeconomic_overview",
+        query="Federal Reserve interest rate decision latest meeting minutes economic outlook",
+        category="monetary_policy",
+        expected_sources=("government_economic", "core_financial", "academic_research"),
+    ),
+    QuerySpec(
+        name="market_sentiment_analysis",
+        query="S&P 500 technical analysis support resistance levels market sentiment VIX",
+        category="technical_analysis",
+        expected_sources=("core_financial", "financial_data", "index_etf"),
+    ),
+    QuerySpec(
+        name="earnings_performance",
+        query="earnings season Q4 2024 results beat miss revenue growth top performers",
+        category="earnings",
+        expected_sources=("core_financial", "earnings_ma_data", "financial_data"),
+    ),
+    QuerySpec(
+        name="technology_innovation",
+        query="artificial intelligence AI breakthrough companies quantum computing development",
+        category="technology",
+        expected_sources=("technology_innovation", "core_financial", "academic_research"),
+    ),
+    QuerySpec(
+        name="healthcare_biotech",
+        query="biotech breakthrough drug development pipeline FDA approval clinical trials",
+        category="healthcare",
+        expected_sources=("healthcare_biotech", "regulatory_legal_data", "core_financial"),
+    ),
+    QuerySpec(
+        name="energy_commodities",
+        query="oil price volatility energy market trends renewable energy transition",
+        category="energy",
+        expected_sources=("energy_environmental", "commodity_trading", "core_financial"),
+    ),
+    QuerySpec(
+        name="real_estate_housing",
+        query="US housing market data home sales existing new construction mortgage rates",
+        category="real_estate",
+        expected_sources=("real_estate", "real_estate_data", "government_economic"),
+    ),
+    QuerySpec(
+        name="employment_labor",
+        query="US unemployment rate jobs report nonfarm payrolls labor market trends",
+        category="employment",
+        expected_sources=("employment_labor", "employment_labor_data", "government_economic"),
+    ),
+    QuerySpec(
+        name="regulatory_legal",
+        query="SEC investigation corporate fraud accounting issues regulatory changes",
+        category="regulatory",
+        expected_sources=("regulatory_legal_data", "core_financial", "government_economic"),
+    ),
+    QuerySpec(
+        name="global_economic_impact",
+        query="China economic growth GDP slowdown US impact global supply chain",
+        category="global_economy",
+        expected_sources=("core_financial", "government_economic", "academic_research"),
+    ),
+)
 
 
 class SerperTestClient:
@@ -26,139 +111,40 @@ class SerperTestClient:
         self.serper_tool = GoogleSerperTool()
         self.output_dir = Path("tmp/google_serper_test_results")
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Queries run concurrently; the semaphore keeps us within Serper rate limits
+        self.max_concurrent_queries = 3
         
-    async def test_broad_queries(self) -> Dict[str, Any]:
+    async def test_broad_queries(self) -> dict[str, Any]:
         """Test 10 broad queries across different categories."""
         
-        # Define 10 broad test queries covering different aspects
-        test_queries = [
-            {
-                "name": "macroeconomic_overview",
-                "query": "Federal Reserve interest rate decision latest meeting minutes economic outlook",
-                "category": "monetary_policy",
-                "expected_sources": ["government_economic", "core_financial", "academic_research"]
-            },
-            {
-                "name": "market_sentiment_analysis",
-                "query": "S&P 500 technical analysis support resistance levels market sentiment VIX",
-                "category": "technical_analysis",
-                "expected_sources": ["core_financial", "financial_data", "index_etf"]
-            },
-            {
-                "name": "earnings_performance",
-                "query": "earnings season Q4 2024 results beat miss revenue growth top performers",
-                "category": "earnings",
-                "expected_sources": ["core_financial", "earnings_ma_data", "financial_data"]
-            },
-            {
-                "name": "technology_innovation",
-                "query": "artificial intelligence AI breakthrough companies quantum computing development",
-                "category": "technology",
-                "expected_sources": ["technology_innovation", "core_financial", "academic_research"]
-            },
-            {
-                "name": "healthcare_biotech",
-                "query": "biotech breakthrough drug development pipeline FDA approval clinical trials",
-                "category": "healthcare",
-                "expected_sources": ["healthcare_biotech", "regulatory_legal_data", "core_financial"]
-            },
-            {
-                "name": "energy_commodities",
-                "query": "oil price volatility energy market trends renewable energy transition",
-                "category": "energy",
-                "expected_sources": ["energy_environmental", "commodity_trading", "core_financial"]
-            },
-            {
-                "name": "real_estate_housing",
-                "query": "US housing market data home sales existing new construction mortgage rates",
-                "category": "real_estate",
-                "expected_sources": ["real_estate", "real_estate_data", "government_economic"]
-            },
-            {
-                "name": "employment_labor",
-                "query": "US unemployment rate jobs report nonfarm payrolls labor market trends",
-                "category": "employment",
-                "expected_sources": ["employment_labor", "employment_labor_data", "government_economic"]
-            },
-            {
-                "name": "regulatory_legal",
-                "query": "SEC investigation corporate fraud accounting issues regulatory changes",
-                "category": "regulatory",
-                "expected_sources": ["regulatory_legal_data", "core_financial", "government_economic"]
-            },
-            {
-                "name": "global_economic_impact",
-                "query": "China economic growth GDP slowdown US impact global supply chain",
-                "category": "global_economy",
-                "expected_sources": ["core_financial", "government_economic", "academic_research"]
-            }
-        ]
+        test_queries = _TEST_QUERIES
+        total_queries = len(test_queries)
         
-        print(f"🚀 Starting Google Serper Test Client")
-        print(f"📁 Output directory: {self.output_dir}")
-        print(f"🔍 Testing {len(test_queries)} broad queries...")
-        print("=" * 80)
+        logger.info("🚀 Starting Google Serper Test Client")
+        logger.info("📁 Output directory: %s", self.output_dir)
+        logger.info("🔍 Testing %d broad queries...", total_queries)
+        logger.info("=" * 80)
         
-        results = {}
-        successful_queries = 0
-        failed_queries = 0
+        semaphore = asyncio.Semaphore(self.max_concurrent_queries)
+        query_outcomes = await asyncio.gather(
+            *(
+                self._run_query(i, total_queries, query_info, semaphore)
+                for i, query_info in enumerate(test_queries, 1)
+            )
+        )
         
-        for i, query_info in enumerate(test_queries, 1):
-            print(f"\n📊 Query {i}/{len(test_queries)}: {query_info['name']}")
-            print(f"🔍 Query: {query_info['query']}")
-            print(f"📂 Category: {query_info['category']}")
-            print(f"🎯 Expected Sources: {', '.join(query_info['expected_sources'])}")
-            
-            try:
-                # Test both single query and staggered search
-                single_result = await self._test_single_query(query_info)
-                staggered_result = await self._test_staggered_search(query_info)
-                
-                # Combine results
-                query_results = {
-                    "query_info": query_info,
-                    "single_search": single_result,
-                    "staggered_search": staggered_result,
-                    "timestamp": datetime.now().isoformat(),
-                    "success": single_result.get("success", False) or staggered_result.get("success", False)
-                }
-                
-                # Save individual query results
-                self._save_query_results(query_info["name"], query_results)
-                
-                results[query_info["name"]] = query_results
-                
-                if query_results["success"]:
-                    successful_queries += 1
-                    print(f"✅ SUCCESS: {single_result.get('total_results', 0)} single results, {staggered_result.get('total_aggregated_results', 0)} staggered results")
-                else:
-                    failed_queries += 1
-                    print(f"❌ FAILED: {single_result.get('error', 'Unknown error')}")
-                
-            except Exception as e:
-                error_result = {
-                    "query_info": query_info,
-                    "error": str(e),
-                    "timestamp": datetime.now().isoformat(),
-                    "success": False
-                }
-                results[query_info["name"]] = error_result
-                failed_queries += 1
-                print(f"❌ EXCEPTION: {str(e)}")
-            
-            # Rate limiting between queries
-            if i < len(test_queries):
-                print("⏳ Waiting 2 seconds before next query...")
-                await asyncio.sleep(2)
+        results = {name: result for name, result in query_outcomes}
+        successful_queries = sum(1 for result in results.values() if result["success"])
+        failed_queries = len(results) - successful_queries
         
         # Generate summary report
         summary = {
             "test_summary": {
-                "total_queries": len(test_queries),
+                "total_queries": total_queries,
                 "successful_queries": successful_queries,
                 "failed_queries": failed_queries,
-                "success_rate": f"{(successful_queries/len(test_queries)*100):.1f}%",
-                "timestamp": datetime.now().isoformat(),
+                "success_rate": f"{(successful_queries/total_queries*100):.1f}%",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "test_duration_seconds": None  # Will be calculated
             },
             "query_results": results
@@ -167,19 +153,81 @@ class SerperTestClient:
         # Save summary report
         self._save_summary_report(summary)
         
-        print("\n" + "=" * 80)
-        print(f"🎯 TEST COMPLETE!")
-        print(f"📊 Results: {successful_queries}/{len(test_queries)} successful ({summary['test_summary']['success_rate']})")
-        print(f"📁 All results saved to: {self.output_dir}")
-        print(f"📋 Summary report: {self.output_dir}/test_summary.json")
+        logger.info("=" * 80)
+        logger.info("🎯 TEST COMPLETE!")
+        logger.info(
+            "📊 Results: %d/%d successful (%s)",
+            successful_queries,
+            total_queries,
+            summary["test_summary"]["success_rate"],
+        )
+        logger.info("📁 All results saved to: %s", self.output_dir)
+        logger.info("📋 Summary report: %s", self.output_dir / "test_summary.json")
         
         return summary
     
-    async def _test_single_query(self, query_info: Dict[str, Any]) -> Dict[str, Any]:
+    async def _run_query(
+        self,
+        i: int,
+        total: int,
+        query_info: QuerySpec,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[str, dict[str, Any]]:
+        """Run single and staggered searches for one query under the semaphore."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        logger.info("📊 Query %d/%d: %s", i, total, query_info.name)
+        logger.info("🔍 Query: %s", query_info.query)
+        logger.info("📂 Category: %s", query_info.category)
+        logger.info("🎯 Expected Sources: %s", query_info.expected_sources_str)
+        
+        try:
+            # Test both single query and staggered search
+            async with semaphore:
+                single_result = await self._test_single_query(query_info)
+                staggered_result = await self._test_staggered_search(query_info)
+            
+            # Combine results
+            query_results = {
+                "query_info": asdict(query_info),
+                "single_search": single_result,
+                "staggered_search": staggered_result,
+                "timestamp": timestamp,
+                "success": single_result.get("success", False) or staggered_result.get("success", False)
+            }
+            
+            # Save individual query results
+            self._save_query_results(query_info.name, query_results)
+            
+            if query_results["success"]:
+                logger.info(
+                    "✅ SUCCESS (%s): %s single results, %s staggered results",
+                    query_info.name,
+                    single_result.get("total_results", 0),
+                    staggered_result.get("total_aggregated_results", 0),
+                )
+            else:
+                logger.warning(
+                    "❌ FAILED (%s): %s",
+                    query_info.name,
+                    single_result.get("error", "Unknown error"),
+                )
+            
+            return query_info.name, query_results
+            
+        except Exception as e:
+            logger.error("❌ EXCEPTION (%s): %s", query_info.name, e)
+            return query_info.name, {
+                "query_info": asdict(query_info),
+                "error": str(e),
+                "timestamp": timestamp,
+                "success": False
+            }
+    
+    async def _test_single_query(self, query_info: QuerySpec) -> dict[str, Any]:
         """Test a single query execution."""
         try:
             params = {
-                "query": query_info["query"],
+                "query": query_info.query,
                 "num_results": 5,
                 "search_type": "search",
                 "country": "us",
@@ -192,16 +240,16 @@ class SerperTestClient:
             
         except Exception as e:
             return {
-                "query": query_info["query"],
+                "query": query_info.query,
                 "error": str(e),
                 "success": False
             }
     
-    async def _test_staggered_search(self, query_info: Dict[str, Any]) -> Dict[str, Any]:
+    async def _test_staggered_search(self, query_info: QuerySpec) -> dict[str, Any]:
         """Test staggered search execution."""
         try:
             params = {
-                "query": query_info["query"],
+                "query": query_info.query,
                 "num_results": 3,  # Lower for staggered to avoid rate limits
                 "search_type": "search",
                 "country": "us",
@@ -214,29 +262,34 @@ class SerperTestClient:
             
         except Exception as e:
             return {
-                "query": query_info["query"],
+                "query": query_info.query,
                 "error": str(e),
                 "success": False
             }
     
-    def _save_query_results(self, query_name: str, results: Dict[str, Any]) -> None:
+    def _save_query_results(self, query_name: str, results: dict[str, Any]) -> None:
         """Save individual query results to JSON file."""
         filename = f"{query_name}_results.json"
         filepath = self.output_dir / filename
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False, default=str)
+        self._write_json_atomic(filepath, results)
         
-        print(f"💾 Saved: {filename}")
+        logger.info("💾 Saved: %s", filename)
     
-    def _save_summary_report(self, summary: Dict[str, Any]) -> None:
+    def _save_summary_report(self, summary: dict[str, Any]) -> None:
         """Save comprehensive summary report."""
         filepath = self.output_dir / "test_summary.json"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+        self._write_json_atomic(filepath, summary)
         
-        print(f"💾 Saved: test_summary.json")
+        logger.info("💾 Saved: test_summary.json")
+    
+    @staticmethod
+    def _write_json_atomic(filepath: Path, data: dict[str, Any]) -> None:
+        """Write JSON to a temp file and swap it in so readers never see a partial file."""
+        tmp_path = filepath.with_suffix(".json.tmp")
+        tmp_path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_path, filepath)
 
 
 async def main():
@@ -246,11 +299,14 @@ async def main():
     try:
         await client.test_broad_queries()
     except KeyboardInterrupt:
-        print("\n⚠️ Test interrupted by user")
+        logger.warning("⚠️ Test interrupted by user")
     except Exception as e:
-        print(f"\n❌ Test failed with error: {str(e)}")
+        logger.error("❌ Test failed with error: %s", e)
         raise
+    finally:
+        await client.serper_tool.aclose()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     asyncio.run(main())
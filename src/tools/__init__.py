@@ -1,7 +1,20 @@
 """Tool implementations for Morning Stock Screener."""
 
+from typing import Any
+
 from .base import BaseTool
-from .google_serper import GoogleSerperTool
-from .search_registry import SearchRegistry
 
 __all__ = ["BaseTool", "GoogleSerperTool", "SearchRegistry"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import tools so importing BaseTool doesn't pull in httpx/settings."""
+    if name == "GoogleSerperTool":
+        from .google_serper import GoogleSerperTool
+
+        return GoogleSerperTool
+    if name == "SearchRegistry":
+        from .search_registry import SearchRegistry
+
+        return SearchRegistry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,11 +1,13 @@
 """Base tool class for Morning Stock Screener tools."""
 
-from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, List
 import logging
-from pathlib import Path
-import json
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from ..utils import dump_json
 
 
 class BaseTool(ABC):
@@ -16,7 +18,7 @@ class BaseTool(ABC):
     like web search, data processing, or external API calls.
     """
 
-    def __init__(self, name: str, output_dir: Optional[Path] = None):
+    def __init__(self, name: str, output_dir: Path | None = None):
         """Initialize the base tool.
         
         Args:
@@ -31,7 +33,7 @@ class BaseTool(ABC):
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     @abstractmethod
-    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         """Execute the tool's main functionality.
         
         Args:
@@ -43,7 +45,7 @@ class BaseTool(ABC):
         pass
 
     @abstractmethod
-    def validate_params(self, params: Dict[str, Any]) -> bool:
+    def validate_params(self, params: dict[str, Any]) -> bool:
         """Validate the input parameters for this tool.
         
         Args:
@@ -55,7 +57,7 @@ class BaseTool(ABC):
         pass
 
     @abstractmethod
-    def format_output(self, raw_output: Any) -> Dict[str, Any]:
+    def format_output(self, raw_output: Any) -> dict[str, Any]:
         """Format and structure the raw output from the tool.
         
         Args:
@@ -66,7 +68,7 @@ class BaseTool(ABC):
         """
         pass
 
-    def save_tool_output(self, output: Any, operation: str, timestamp: Optional[datetime] = None) -> Path:
+    def save_tool_output(self, output: Any, operation: str, timestamp: datetime | None = None) -> Path:
         """Save tool output to the output directory for analysis.
         
         Args:
@@ -88,27 +90,16 @@ class BaseTool(ABC):
         filename = f"{operation}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         output_path = tool_dir / filename
         
-        # Save output as JSON
+        # Save output as JSON; orjson encodes straight to UTF-8 bytes
         try:
-            if isinstance(output, dict):
-                # Add metadata
-                output_with_metadata = {
-                    "tool": self.name,
-                    "operation": operation,
-                    "timestamp": timestamp.isoformat(),
-                    "data": output
-                }
-            else:
-                # Wrap non-dict output
-                output_with_metadata = {
-                    "tool": self.name,
-                    "operation": operation,
-                    "timestamp": timestamp.isoformat(),
-                    "data": str(output)
-                }
-                
-            with open(output_path, 'w') as f:
-                json.dump(output_with_metadata, f, indent=2, default=str)
+            payload = {
+                "tool": self.name,
+                "operation": operation,
+                "timestamp": timestamp.isoformat(),
+                # Wrap non-dict output as a string
+                "data": output if isinstance(output, dict) else str(output)
+            }
+            output_path.write_bytes(dump_json(payload))
                 
             self.logger.info(f"Saved tool output to {output_path}")
             return output_path
@@ -117,7 +108,7 @@ class BaseTool(ABC):
             self.logger.error(f"Failed to save tool output: {e}")
             raise
 
-    def log_execution_start(self, params: Dict[str, Any]):
+    def log_execution_start(self, params: dict[str, Any]):
         """Log the start of tool execution.
         
         Args:
@@ -126,7 +117,7 @@ class BaseTool(ABC):
         self.logger.info(f"Starting {self.name} execution")
         self.logger.debug(f"Input parameters: {params}")
 
-    def log_execution_complete(self, output: Dict[str, Any]):
+    def log_execution_complete(self, output: dict[str, Any]):
         """Log the completion of tool execution.
         
         Args:
@@ -147,7 +138,7 @@ class BaseTool(ABC):
             error_msg += f" (Context: {context})"
         self.logger.error(error_msg)
 
-    async def run(self, params: Dict[str, Any], save_output: bool = True) -> Dict[str, Any]:
+    async def run(self, params: dict[str, Any], save_output: bool = True) -> dict[str, Any]:
         """Main entry point to run the tool with full logging and error handling.
         
         Args:
@@ -189,7 +180,7 @@ class BaseTool(ABC):
             self.log_error(e, f"params={params}")
             raise RuntimeError(f"Tool {self.name} execution failed: {e}") from e
 
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Sequence[str]:
         """Get a list of capabilities this tool provides.
         
         Returns:
@@ -197,7 +188,7 @@ class BaseTool(ABC):
         """
         return [self.name]
 
-    def get_required_params(self) -> List[str]:
+    def get_required_params(self) -> Sequence[str]:
         """Get a list of required parameters for this tool.
         
         Returns:
@@ -205,7 +196,7 @@ class BaseTool(ABC):
         """
         return []
 
-    def get_optional_params(self) -> List[str]:
+    def get_optional_params(self) -> Sequence[str]:
         """Get a list of optional parameters for this tool.
         
         Returns:
@@ -213,7 +204,7 @@ class BaseTool(ABC):
         """
         return []
 
-    def get_example_usage(self) -> Dict[str, Any]:
+    def get_example_usage(self) -> dict[str, Any]:
         """Get an example of how to use this tool.
         
         Returns:
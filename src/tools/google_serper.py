@@ -1,13 +1,221 @@
 """Google Serper tool for web search functionality."""
 
 import asyncio
-import httpx
-from typing import Any, Dict, List, Optional
+import copy
+import importlib.util
+import random
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from itertools import chain
 from pathlib import Path
-import logging
+from typing import Any
+
+import httpx
+import orjson
 
-from .base import BaseTool
 from ..config import get_settings
+from .base import BaseTool
+
+# HTTP/2 needs the h2 package (installed by the httpx[http2] extra)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Serper "tbm" value for each non-web search type
+_TBM = {"news": "nws", "images": "isch", "videos": "vid"}
+
+_BASE_HEADERS = {"Content-Type": "application/json"}
+
+# Sentinel for optional params that were not passed at all
+_MISSING = object()
+
+# Website categories for staggered searching using ALL the comprehensive websites
+_CATEGORY_SITES: tuple[dict[str, Any], ...] = (
+    # Category 1: Core Financial News & Analysis
+    {
+        "name": "core_financial",
+        "sites": ("yahoo.com/finance", "cnbc.com", "bloomberg.com", "marketwatch.com", 
+                 "reuters.com", "ft.com", "forbes.com", "wsj.com", "money.cnn.com",
+                 "thestreet.com", "investopedia.com", "google.com/finance")
+    },
+    # Category 2: Financial Data & Analysis Platforms
+    {
+        "name": "data_platforms",
+        "sites": ("stockanalysis.com", "wallstreetzen.com", "finbox.com", "simplywall.st",
+                 "investing.com", "tradingview.com", "morningstar.com", "marketbeat.com",
+                 "fool.com", "seekingalpha.com", "alphaquery.com", "quiverquant.com",
+                 "finviz.com", "stocktwits.com", "tipranks.com", "zacks.com")
+    },
+    # Category 3: Government & Central Bank Sources (Critical for Macro Data)
+    {
+        "name": "government_central_banks",
+        "sites": ("federalreserve.gov", "bls.gov", "bea.gov", "census.gov", "treasury.gov",
+                 "sec.gov", "fdic.gov", "cftc.gov", "irs.gov", "whitehouse.gov/cea")
+    },
+    # Category 4: Economic Data & Research
+    {
+        "name": "economic_research",
+        "sites": ("fred.stlouisfed.org", "worldbank.org", "imf.org", "oecd.org",
+                 "ecb.europa.eu", "bankofengland.co.uk", "boj.or.jp", "pboc.gov.cn",
+                 "bis.org", "nber.org", "brookings.edu", "cepr.org")
+    },
+    # Category 5: Index & ETF Providers
+    {
+        "name": "index_etf_providers",
+        "sites": ("spglobal.com", "nasdaq.com", "nyse.com", "cboe.com", "vix.com",
+                 "ishares.com", "vanguard.com", "spdrs.com", "invesco.com",
+                 "schwab.com", "fidelity.com", "tdameritrade.com")
+    },
+    # Category 6: Credit Rating & Risk Agencies
+    {
+        "name": "credit_ratings_risk",
+        "sites": ("standardandpoors.com", "moodys.com", "fitchratings.com",
+                 "kroll.com", "am-best.com", "dbrs.com")
+    },
+    # Category 7: Commodity & Currency Data
+    {
+        "name": "commodities_currencies",
+        "sites": ("kitco.com", "oilprice.com", "goldprice.org", "copper.org",
+                 "lme.com", "comex.com", "nymex.com", "ice.com")
+    },
+    # Category 8: Real Estate & Housing Data
+    {
+        "name": "real_estate_housing",
+        "sites": ("realtor.com", "zillow.com", "redfin.com", "huduser.gov",
+                 "nahb.org", "nar.realtor", "freddiemac.com", "fanniemae.com")
+    },
+    # Category 9: Employment & Labor Data
+    {
+        "name": "employment_labor",
+        "sites": ("bls.gov", "dol.gov", "adp.com", "indeed.com", "linkedin.com",
+                 "glassdoor.com", "salary.com", "payscale.com")
+    },
+    # Category 10: Manufacturing & Industrial Data
+    {
+        "name": "manufacturing_industrial",
+        "sites": ("ismworld.org", "chicagofed.org", "philadelphiafed.org",
+                 "richmondfed.org", "kc.frb.org", "dallasfed.org")
+    },
+    # Category 11: Technology & Innovation Data
+    {
+        "name": "technology_innovation",
+        "sites": ("gartner.com", "forrester.com", "idc.com", "statista.com",
+                 "crunchbase.com", "pitchbook.com", "cbinsights.com")
+    },
+    # Category 12: Healthcare & Biotech Data
+    {
+        "name": "healthcare_biotech",
+        "sites": ("fda.gov", "nih.gov", "cdc.gov", "who.int", "biospace.com",
+                 "genomeweb.com", "fiercebiotech.com", "biopharmadive.com")
+    },
+    # Category 13: Energy & Environmental Data
+    {
+        "name": "energy_environmental",
+        "sites": ("eia.gov", "epa.gov", "iea.org", "opec.org", "bp.com",
+                 "shell.com", "exxonmobil.com", "chevron.com")
+    },
+    # Category 14: Academic & Research Institutions
+    {
+        "name": "academic_research",
+        "sites": ("harvard.edu", "mit.edu", "stanford.edu", "princeton.edu",
+                 "chicagobooth.edu", "wharton.upenn.edu", "columbia.edu")
+    },
+    # Category 15: Professional Associations & Standards
+    {
+        "name": "professional_associations",
+        "sites": ("cfainstitute.org", "garp.org", "prmia.org", "iafe.org",
+                 "sifma.org", "icma.org", "isda.org")
+    },
+    # Category 16: Alternative Data & Social Sentiment
+    {
+        "name": "alternative_social_sentiment",
+        "sites": ("reddit.com/r/stocks", "reddit.com/r/ValueInvesting", 
+                 "reddit.com/r/wallstreetbets", "reddit.com/r/investing", 
+                 "twitter.com", "stocktwits.com", "glassdoor.com", "indeed.com", "linkedin.com")
+    },
+    # Category 17: Regulatory & Legal Sources
+    {
+        "name": "regulatory_legal",
+        "sites": ("supremecourt.gov", "congress.gov", "gao.gov", "cbo.gov",
+                 "federalregister.gov", "regulations.gov")
+    },
+    # Category 18: International Financial Centers
+    {
+        "name": "international_financial_centers",
+        "sites": ("londonstockexchange.com", "deutsche-boerse.com", "euronext.com",
+                 "tmx.com", "asx.com.au", "sgx.com", "hkex.com.hk",
+                 "tse.or.jp", "bseindia.com", "nseindia.com")
+    }
+)
+
+# Each category's "site:" filter is joined once here rather than on every search
+_WEBSITE_CATEGORIES: tuple[dict[str, Any], ...] = tuple(
+    {**category, "site_filter": " OR ".join(f"site:{site}" for site in category["sites"])}
+    for category in _CATEGORY_SITES
+)
+
+
+# Usage examples; the getters hand out deep copies so callers get plain,
+# JSON-serializable dicts they may modify
+_EXAMPLE_USAGE: dict[str, Any] = {
+    "description": "Perform a web search using Google Serper API",
+    "params": {
+        "query": "latest stock market news",
+        "num_results": 10,
+        "search_type": "news",
+        "country": "us",
+        "language": "en"
+    },
+    "expected_output": {
+        "query": "latest stock market news",
+        "search_type": "news",
+        "num_results": 10,
+        "organic_results": "List of news articles",
+        "success": True
+    }
+}
+
+_STAGGERED_SEARCH_EXAMPLE: dict[str, Any] = {
+    "description": "Perform a comprehensive staggered search across all financial websites",
+    "method": "execute_staggered_search",
+    "params": {
+        "query": "Apple stock analysis Q4 2024",
+        "num_results": 5,
+        "search_type": "search",
+        "max_searches": 18,
+        "country": "us",
+        "language": "en"
+    },
+    "expected_output": {
+        "query": "Apple stock analysis Q4 2024",
+        "staggered_search": True,
+        "search_metadata": {
+            "total_searches": 18,
+            "successful_searches": "Number of successful category searches",
+            "total_results": "Total aggregated results from all sources"
+        },
+        "all_results": "Comprehensive results from 100+ financial websites",
+        "success": True
+    }
+}
+
+
+def _is_new_link(item: dict[str, Any], seen_links: set[str]) -> bool:
+    """Record a result's normalized link and report whether it was new.
+    
+    Args:
+        item: Organic search result
+        seen_links: Normalized links already kept, updated in place
+        
+    Returns:
+        True if the result has no link or its link was not seen before
+    """
+    link = (item.get("link") or "").split("#", 1)[0].rstrip("/")
+    if not link:
+        return True
+    if link in seen_links:
+        return False
+    seen_links.add(link)
+    return True
 
 
 class GoogleSerperTool(BaseTool):
@@ -17,7 +225,26 @@ class GoogleSerperTool(BaseTool):
     which offers fast and reliable Google search results.
     """
 
-    def __init__(self, output_dir: Optional[Path] = None):
+    # Tool metadata is constant, so it is built once and shared read-only
+    _CAPABILITIES: tuple[str, ...] = (
+        "web_search",
+        "news_search",
+        "image_search",
+        "video_search",
+        "knowledge_graph",
+        "related_questions",
+        "staggered_comprehensive_search"
+    )
+    _REQUIRED_PARAMS: tuple[str, ...] = ("query",)
+    _OPTIONAL_PARAMS: tuple[str, ...] = (
+        "num_results",
+        "search_type",
+        "country",
+        "language",
+        "filter_sites"
+    )
+
+    def __init__(self, output_dir: Path | None = None) -> None:
         """Initialize the Google Serper tool.
         
         Args:
@@ -28,12 +255,32 @@ class GoogleSerperTool(BaseTool):
         self.api_key = self.settings.serper_api_key
         self.base_url = "https://google.serper.dev/search"
         
-        # Rate limiting settings
+        # Rate limiting settings (token bucket shared by all concurrent requests)
         self.max_requests_per_minute = 100  # Serper free tier limit
-        self.request_delay = 60.0 / self.max_requests_per_minute  # Delay between requests
-        self.last_request_time = 0.0
+        self.rate_limit_burst = 10  # Requests allowed back-to-back before throttling
+        self._tokens = float(self.rate_limit_burst)
+        self._last_refill: float | None = None
+        
+        # Maximum category searches in flight during a staggered search
+        self.max_concurrent_searches = 10
+        
+        # Retries for category searches that hit 429 or 5xx, with jittered exponential backoff
+        self.max_retries = 2
+        self.retry_backoff_min = 1.0
+        self.retry_backoff_max = 16.0
+        
+        # Shared HTTP client so connections are reused across requests
+        self._client: httpx.AsyncClient | None = None
+        
+        # Upper bound on a streamed response body so one oversized reply can't spike memory
+        self.max_response_bytes = 5 * 1024 * 1024
+        
+        # In-memory TTL cache of successful responses keyed by query and params
+        self.cache_ttl_seconds = 600.0
+        self.cache_maxsize = 1024
+        self._cache: OrderedDict[tuple[Any, ...], tuple[float, dict[str, Any]]] = OrderedDict()
 
-    def validate_params(self, params: Dict[str, Any]) -> bool:
+    def validate_params(self, params: dict[str, Any]) -> bool:
         """Validate search parameters.
         
         Args:
@@ -42,35 +289,34 @@ class GoogleSerperTool(BaseTool):
         Returns:
             True if parameters are valid, False otherwise
         """
-        required_fields = ["query"]
-        
-        # Check required fields
-        for field in required_fields:
-            if field not in params:
-                self.logger.error(f"Missing required field: {field}")
-                return False
+        get = params.get
         
-        # Check query is not empty
-        if not params["query"] or not params["query"].strip():
+        # Check required query is present and not empty
+        query = get("query", _MISSING)
+        if query is _MISSING:
+            self.logger.error("Missing required field: query")
+            return False
+        if not query or not isinstance(query, str) or not query.strip():
             self.logger.error("Query cannot be empty")
             return False
         
-        # Check optional fields
-        if "num_results" in params:
-            num_results = params["num_results"]
-            if not isinstance(num_results, int) or num_results < 1 or num_results > 100:
-                self.logger.error("num_results must be an integer between 1 and 100")
-                return False
+        # Check optional fields; bool is rejected even though it subclasses int
+        num_results = get("num_results", _MISSING)
+        if num_results is not _MISSING and (
+            type(num_results) is not int or not 1 <= num_results <= 100
+        ):
+            self.logger.error("num_results must be an integer between 1 and 100")
+            return False
         
         # Check filter_sites parameter
-        if "filter_sites" in params:
-            if not isinstance(params["filter_sites"], bool):
-                self.logger.error("filter_sites must be a boolean")
-                return False
+        filter_sites = get("filter_sites", _MISSING)
+        if filter_sites is not _MISSING and type(filter_sites) is not bool:
+            self.logger.error("filter_sites must be a boolean")
+            return False
         
         return True
 
-    async def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute(self, params: dict[str, Any]) -> dict[str, Any]:
         """Execute a web search using Serper API.
         
         Args:
@@ -85,97 +331,290 @@ class GoogleSerperTool(BaseTool):
         Returns:
             Dictionary containing search results and metadata
         """
-        # Rate limiting
-        await self._rate_limit()
-        
         # Extract parameters
         query = params["query"].strip()
         num_results = params.get("num_results", 10)
         search_type = params.get("search_type", "search")
         country = params.get("country", "us")
         language = params.get("language", "en")
+        filter_sites = params.get("filter_sites", True)
         
-        # Prepare request payload
-        payload = {
-            "q": query,
-            "num": min(num_results, 100),  # Ensure we don't exceed API limits
-            "gl": country,
-            "hl": language
-        }
+        # Serve repeated searches from the cache without touching the API
+        cache_key = (query, search_type, country, language, num_results, filter_sites)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
-        # Add search type specific parameters
-        if search_type == "news":
-            payload["tbm"] = "nws"
-        elif search_type == "images":
-            payload["tbm"] = "isch"
-        elif search_type == "videos":
-            payload["tbm"] = "vid"
+        # Rate limiting
+        await self._rate_limit()
+        
+        payload = self._build_payload(query, num_results, search_type, country, language)
         
         # Add intelligent site filtering based on query type and content
-        if params.get("filter_sites", True):
+        if filter_sites:
             relevant_sites = self._get_relevant_sites_for_query(query, search_type)
             if relevant_sites:
                 site_filter = " OR ".join([f"site:{site}" for site in relevant_sites])
                 payload["q"] = f"({payload['q']}) ({site_filter})"
         
-        headers = {
-            "X-API-KEY": self.api_key,
-            "Content-Type": "application/json"
+        try:
+            search_results = await self._post_json(payload)
+        except Exception as e:
+            result = self._error_result(query, e)
+            self.logger.error("%s", result["error"])
+            return result
+        
+        # Log successful search
+        self.logger.info(
+            "Search completed: '%s' returned %d results", query, len(search_results.get("organic", []))
+        )
+        
+        result = {
+            "query": query,
+            "search_type": search_type,
+            "num_results": num_results,
+            "country": country,
+            "language": language,
+            "raw_results": search_results,
+            "success": True
         }
+        self._cache_set(cache_key, result)
+        return result
+
+    async def _execute_batch(
+        self,
+        queries: list[str],
+        num_results: int,
+        search_type: str,
+        country: str,
+        language: str
+    ) -> list[dict[str, Any]]:
+        """Run several searches in a single request to Serper.
         
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.base_url,
-                    json=payload,
-                    headers=headers
-                )
+        Serper accepts a JSON array of query objects on the search endpoint and
+        answers with an array of results in the same order. Cached queries are
+        answered locally and only the rest are sent. The batch takes one
+        rate-limit token.
+        
+        Args:
+            queries: Fully built query strings (site filters already applied)
+            num_results: Number of results per query
+            search_type: Type of search
+            country: Country code for localized results
+            language: Language code
+            
+        Returns:
+            One result dictionary per query, in the same shape as execute returns
+        """
+        cache_keys = [(query, search_type, country, language, num_results, False) for query in queries]
+        results: dict[int, dict[str, Any]] = {}
+        for i, key in enumerate(cache_keys):
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+        pending = [i for i in range(len(queries)) if i not in results]
+        
+        if pending:
+            await self._rate_limit()
+            
+            payloads = [
+                self._build_payload(queries[i], num_results, search_type, country, language)
+                for i in pending
+            ]
+            try:
+                batch_results = await self._post_json(payloads)
+                if not isinstance(batch_results, list) or len(batch_results) != len(payloads):
+                    raise ValueError("Batch response does not match the number of queries")
+            except Exception as e:
+                error_result = self._error_result(f"batch of {len(payloads)} queries", e)
+                self.logger.error("%s", error_result["error"])
+                for i in pending:
+                    results[i] = {**error_result, "query": queries[i]}
+            else:
+                self.logger.info("Batch search completed: %d queries in one request", len(payloads))
                 
+                for i, search_results in zip(pending, batch_results):
+                    result = {
+                        "query": queries[i],
+                        "search_type": search_type,
+                        "num_results": num_results,
+                        "country": country,
+                        "language": language,
+                        "raw_results": search_results,
+                        "success": True
+                    }
+                    self._cache_set(cache_keys[i], result)
+                    results[i] = result
+        
+        return [results[i] for i in range(len(queries))]
+
+    def _build_payload(
+        self,
+        query: str,
+        num_results: int,
+        search_type: str,
+        country: str,
+        language: str
+    ) -> dict[str, Any]:
+        """Build the Serper request body for one query.
+        
+        Args:
+            query: Search query string
+            num_results: Number of results to return
+            search_type: Type of search
+            country: Country code for localized results
+            language: Language code
+            
+        Returns:
+            Request payload dictionary
+        """
+        payload = {
+            "q": query,
+            "num": min(num_results, 100),  # Ensure we don't exceed API limits
+            "gl": country,
+            "hl": language
+        }
+        
+        # Add search type specific parameters
+        tbm = _TBM.get(search_type)
+        if tbm:
+            payload["tbm"] = tbm
+        
+        return payload
+
+    async def _post_json(self, body: Any) -> Any:
+        """POST a JSON body to the Serper search endpoint and decode the reply.
+        
+        Args:
+            body: Request payload, a single query object or a list of them
+            
+        Returns:
+            Decoded JSON response
+            
+        Raises:
+            httpx.HTTPStatusError: If Serper returns an error status
+            httpx.RequestError: If the request fails
+        """
+        headers = {**_BASE_HEADERS, "X-API-KEY": self.api_key or ""}
+        
+        client = self._get_client()
+        async with client.stream(
+            "POST",
+            self.base_url,
+            content=orjson.dumps(body),
+            headers=headers
+        ) as response:
+            self.logger.debug("Serper responded over %s", response.http_version)
+            if response.is_error:
+                await response.aread()
                 response.raise_for_status()
-                search_results = response.json()
-                
-                # Log successful search
-                self.logger.info(f"Search completed: '{query}' returned {len(search_results.get('organic', []))} results")
-                
-                return {
-                    "query": query,
-                    "search_type": search_type,
-                    "num_results": num_results,
-                    "country": country,
-                    "language": language,
-                    "raw_results": search_results,
-                    "success": True
-                }
-                
-        except httpx.HTTPStatusError as e:
-            error_msg = f"HTTP error {e.response.status_code}: {e.response.text}"
-            self.logger.error(error_msg)
+            raw_body = await self._read_body(response)
+        
+        return orjson.loads(raw_body)
+
+    @staticmethod
+    def _error_result(query: str, error: Exception) -> dict[str, Any]:
+        """Build the failure result for a search that raised.
+        
+        Args:
+            query: Query the search was for
+            error: Exception raised by the request
+            
+        Returns:
+            Failure dictionary with an error message and, for HTTP errors, the status code
+        """
+        if isinstance(error, httpx.HTTPStatusError):
             return {
                 "query": query,
-                "error": error_msg,
+                "error": f"HTTP error {error.response.status_code}: {error.response.text}",
                 "success": False,
-                "http_status": e.response.status_code
+                "http_status": error.response.status_code
             }
+        if isinstance(error, httpx.RequestError):
+            return {"query": query, "error": f"Request error: {str(error)}", "success": False}
+        return {"query": query, "error": f"Unexpected error: {str(error)}", "success": False}
+
+    async def _read_body(self, response: httpx.Response) -> bytearray:
+        """Read a streamed response body, refusing bodies over max_response_bytes.
+        
+        Args:
+            response: Streamed HTTP response
             
-        except httpx.RequestError as e:
-            error_msg = f"Request error: {str(e)}"
-            self.logger.error(error_msg)
-            return {
-                "query": query,
-                "error": error_msg,
-                "success": False
-            }
+        Returns:
+            Response body bytes
             
-        except Exception as e:
-            error_msg = f"Unexpected error: {str(e)}"
-            self.logger.error(error_msg)
-            return {
-                "query": query,
-                "error": error_msg,
-                "success": False
-            }
+        Raises:
+            ValueError: If the body exceeds max_response_bytes
+        """
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > self.max_response_bytes:
+                raise ValueError(f"Response exceeded {self.max_response_bytes} bytes")
+        return body
+
+    def _cache_get(self, key: tuple[Any, ...]) -> dict[str, Any] | None:
+        """Look up a cached search result.
+        
+        Args:
+            key: Cache key built from the query and search parameters
+            
+        Returns:
+            Deep copy of the cached result marked with cache_hit, or None if
+            the key is missing or expired
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._cache[key]
+            return None
+        
+        self._cache.move_to_end(key)
+        cached = copy.deepcopy(result)
+        cached["cache_hit"] = True
+        return cached
+
+    def _cache_set(self, key: tuple[Any, ...], result: dict[str, Any]) -> None:
+        """Store a successful search result, evicting the oldest entry when full.
+        
+        Args:
+            key: Cache key built from the query and search parameters
+            result: Successful search result to cache
+        """
+        self._cache[key] = (time.monotonic() + self.cache_ttl_seconds, copy.deepcopy(result))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_maxsize:
+            self._cache.popitem(last=False)
 
-    def format_output(self, raw_output: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use.
+        
+        Returns:
+            Pooled async HTTP client reused across searches
+        """
+        if self._client is None or self._client.is_closed:
+            if _HTTP2_AVAILABLE:
+                # One HTTP/2 connection multiplexes many concurrent searches
+                limits = httpx.Limits(max_keepalive_connections=4, max_connections=4)
+            else:
+                limits = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2_AVAILABLE,
+                timeout=30.0,
+                limits=limits
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and release its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def format_output(self, raw_output: dict[str, Any]) -> dict[str, Any]:
         """Format and structure the raw search results.
         
         Args:
@@ -189,21 +628,17 @@ class GoogleSerperTool(BaseTool):
         
         raw_results = raw_output.get("raw_results", {})
         
-        # Extract and format organic results
-        organic_results = []
-        for result in raw_results.get("organic", [])[:raw_output.get("num_results", 10)]:
-            formatted_result = {
+        # Extract and format organic results, keeping sitelinks when available
+        organic_results = [
+            {
                 "title": result.get("title", ""),
                 "link": result.get("link", ""),
                 "snippet": result.get("snippet", ""),
-                "position": result.get("position", 0)
+                "position": result.get("position", 0),
+                **({"sitelinks": result["sitelinks"]} if "sitelinks" in result else {})
             }
-            
-            # Add additional fields if available
-            if "sitelinks" in result:
-                formatted_result["sitelinks"] = result["sitelinks"]
-            
-            organic_results.append(formatted_result)
+            for result in raw_results.get("organic", [])[:raw_output.get("num_results", 10)]
+        ]
         
         # Extract knowledge graph if available
         knowledge_graph = None
@@ -218,13 +653,14 @@ class GoogleSerperTool(BaseTool):
             }
         
         # Extract related questions if available
-        related_questions = []
-        for q in raw_results.get("relatedQuestions", []):
-            related_questions.append({
+        related_questions = [
+            {
                 "question": q.get("question", ""),
                 "answer": q.get("answer", ""),
                 "source": q.get("source", "")
-            })
+            }
+            for q in raw_results.get("relatedQuestions", [])
+        ]
         
         # Format final output
         formatted_output = {
@@ -246,7 +682,7 @@ class GoogleSerperTool(BaseTool):
         
         return formatted_output
 
-    def _get_relevant_sites_for_query(self, query: str, search_type: str) -> List[str]:
+    def _get_relevant_sites_for_query(self, query: str, search_type: str) -> list[str]:
         """Intelligently select the most relevant websites based on query content and search type.
         
         This method analyzes the query and search type to determine which websites are most relevant,
@@ -430,7 +866,7 @@ class GoogleSerperTool(BaseTool):
         }
         
         # Determine which categories are relevant based on query content
-        relevant_categories = []
+        relevant_categories: list[str] = []
         
         # Always include core financial for financial queries
         relevant_categories.append("core_financial")
@@ -506,14 +942,14 @@ class GoogleSerperTool(BaseTool):
         
         # Remove duplicates and flatten the list
         unique_categories = list(set(relevant_categories))
-        relevant_sites = []
+        relevant_sites: list[str] = []
         for category in unique_categories:
             relevant_sites.extend(website_categories[category])
         
         # Limit to reasonable number to avoid query length issues
         return relevant_sites[:25]  # Keep queries manageable
 
-    async def execute_staggered_search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def execute_staggered_search(self, params: dict[str, Any]) -> dict[str, Any]:
         """Execute a comprehensive search using staggered queries across ALL financial websites.
         
         This method implements the "holding pen" approach by running multiple focused searches
@@ -528,6 +964,7 @@ class GoogleSerperTool(BaseTool):
                 - country: Country code for localized results (optional)
                 - language: Language code (optional)
                 - max_searches: Maximum number of staggered searches (optional, default 18)
+                - batch: Send all category queries in one batch request (optional, default False)
                 
         Returns:
             Dictionary containing aggregated search results from all sources
@@ -539,181 +976,59 @@ class GoogleSerperTool(BaseTool):
         language = params.get("language", "en")
         max_searches = params.get("max_searches", 18)
         
-        # Define website categories for staggered searching using ALL the comprehensive websites
-        website_categories = [
-            # Category 1: Core Financial News & Analysis
-            {
-                "name": "core_financial",
-                "sites": ["yahoo.com/finance", "cnbc.com", "bloomberg.com", "marketwatch.com", 
-                         "reuters.com", "ft.com", "forbes.com", "wsj.com", "money.cnn.com",
-                         "thestreet.com", "investopedia.com", "google.com/finance"]
-            },
-            # Category 2: Financial Data & Analysis Platforms
-            {
-                "name": "data_platforms", 
-                "sites": ["stockanalysis.com", "wallstreetzen.com", "finbox.com", "simplywall.st",
-                         "investing.com", "tradingview.com", "morningstar.com", "marketbeat.com",
-                         "fool.com", "seekingalpha.com", "alphaquery.com", "quiverquant.com",
-                         "finviz.com", "stocktwits.com", "tipranks.com", "zacks.com"]
-            },
-            # Category 3: Government & Central Bank Sources (Critical for Macro Data)
-            {
-                "name": "government_central_banks",
-                "sites": ["federalreserve.gov", "bls.gov", "bea.gov", "census.gov", "treasury.gov",
-                         "sec.gov", "fdic.gov", "cftc.gov", "irs.gov", "whitehouse.gov/cea"]
-            },
-            # Category 4: Economic Data & Research
-            {
-                "name": "economic_research",
-                "sites": ["fred.stlouisfed.org", "worldbank.org", "imf.org", "oecd.org",
-                         "ecb.europa.eu", "bankofengland.co.uk", "boj.or.jp", "pboc.gov.cn",
-                         "bis.org", "nber.org", "brookings.edu", "cepr.org"]
-            },
-            # Category 5: Index & ETF Providers
-            {
-                "name": "index_etf_providers",
-                "sites": ["spglobal.com", "nasdaq.com", "nyse.com", "cboe.com", "vix.com",
-                         "ishares.com", "vanguard.com", "spdrs.com", "invesco.com",
-                         "schwab.com", "fidelity.com", "tdameritrade.com"]
-            },
-            # Category 6: Credit Rating & Risk Agencies
-            {
-                "name": "credit_ratings_risk",
-                "sites": ["standardandpoors.com", "moodys.com", "fitchratings.com",
-                         "kroll.com", "am-best.com", "dbrs.com"]
-            },
-            # Category 7: Commodity & Currency Data
-            {
-                "name": "commodities_currencies",
-                "sites": ["kitco.com", "oilprice.com", "goldprice.org", "copper.org",
-                         "lme.com", "comex.com", "nymex.com", "ice.com"]
-            },
-            # Category 8: Real Estate & Housing Data
-            {
-                "name": "real_estate_housing",
-                "sites": ["realtor.com", "zillow.com", "redfin.com", "huduser.gov",
-                         "nahb.org", "nar.realtor", "freddiemac.com", "fanniemae.com"]
-            },
-            # Category 9: Employment & Labor Data
-            {
-                "name": "employment_labor",
-                "sites": ["bls.gov", "dol.gov", "adp.com", "indeed.com", "linkedin.com",
-                         "glassdoor.com", "salary.com", "payscale.com"]
-            },
-            # Category 10: Manufacturing & Industrial Data
-            {
-                "name": "manufacturing_industrial",
-                "sites": ["ismworld.org", "chicagofed.org", "philadelphiafed.org",
-                         "richmondfed.org", "kc.frb.org", "dallasfed.org"]
-            },
-            # Category 11: Technology & Innovation Data
-            {
-                "name": "technology_innovation",
-                "sites": ["gartner.com", "forrester.com", "idc.com", "statista.com",
-                         "crunchbase.com", "pitchbook.com", "cbinsights.com"]
-            },
-            # Category 12: Healthcare & Biotech Data
-            {
-                "name": "healthcare_biotech",
-                "sites": ["fda.gov", "nih.gov", "cdc.gov", "who.int", "biospace.com",
-                         "genomeweb.com", "fiercebiotech.com", "biopharmadive.com"]
-            },
-            # Category 13: Energy & Environmental Data
-            {
-                "name": "energy_environmental",
-                "sites": ["eia.gov", "epa.gov", "iea.org", "opec.org", "bp.com",
-                         "shell.com", "exxonmobil.com", "chevron.com"]
-            },
-            # Category 14: Academic & Research Institutions
-            {
-                "name": "academic_research",
-                "sites": ["harvard.edu", "mit.edu", "stanford.edu", "princeton.edu",
-                         "chicagobooth.edu", "wharton.upenn.edu", "columbia.edu"]
-            },
-            # Category 15: Professional Associations & Standards
-            {
-                "name": "professional_associations",
-                "sites": ["cfainstitute.org", "garp.org", "prmia.org", "iafe.org",
-                         "sifma.org", "icma.org", "isda.org"]
-            },
-            # Category 16: Alternative Data & Social Sentiment
-            {
-                "name": "alternative_social_sentiment",
-                "sites": ["reddit.com/r/stocks", "reddit.com/r/ValueInvesting", 
-                         "reddit.com/r/wallstreetbets", "reddit.com/r/investing", 
-                         "twitter.com", "stocktwits.com", "glassdoor.com", "indeed.com", "linkedin.com"]
-            },
-            # Category 17: Regulatory & Legal Sources
-            {
-                "name": "regulatory_legal",
-                "sites": ["supremecourt.gov", "congress.gov", "gao.gov", "cbo.gov",
-                         "federalregister.gov", "regulations.gov"]
-            },
-            # Category 18: International Financial Centers
-            {
-                "name": "international_financial_centers",
-                "sites": ["londonstockexchange.com", "deutsche-boerse.com", "euronext.com",
-                         "tmx.com", "asx.com.au", "sgx.com", "hkex.com.hk",
-                         "tse.or.jp", "bseindia.com", "nseindia.com"]
-            }
-        ]
-        
         # Limit to max_searches to avoid overwhelming the API
-        website_categories = website_categories[:max_searches]
+        website_categories = _WEBSITE_CATEGORIES[:max_searches]
         
-        all_results = []
-        search_metadata = {
+        search_metadata: dict[str, Any] = {
             "total_searches": len(website_categories),
             "successful_searches": 0,
             "failed_searches": 0,
             "total_results": 0,
+            "duplicates_skipped": 0,
+            "retries": 0,
             "categories_searched": []
         }
+        organic_lists: list[list[dict[str, Any]]] = []
         
-        # Execute staggered searches
-        for i, category in enumerate(website_categories):
-            try:
-                # Rate limit between searches
-                if i > 0:
-                    await self._rate_limit()
-                
-                # Create category-specific query
-                category_sites = " OR ".join([f"site:{site}" for site in category["sites"]])
-                category_query = f"({base_query}) ({category_sites})"
-                
-                # Execute search for this category
-                category_params = {
-                    "query": category_query,
-                    "num_results": num_results,
-                    "search_type": search_type,
-                    "country": country,
-                    "language": language,
-                    "filter_sites": False  # Don't apply additional filtering since we're already filtering
-                }
+        # Collect outcomes as categories finish, then aggregate in category order
+        # so deduplication and categories_searched stay deterministic
+        outcomes_by_name: dict[str, dict[str, Any]] = {}
+        async for category_name, result in self.execute_staggered_search_stream(params):
+            outcomes_by_name[category_name] = result
+        category_outcomes = [outcomes_by_name[category["name"]] for category in website_categories]
+        
+        for category, result in zip(website_categories, category_outcomes):
+            search_metadata["retries"] += result.get("retries", 0)
+            if result.get("success", False):
+                # Add category metadata to results
+                category_results = result.get("raw_results", {}).get("organic", [])
+                for item in category_results:
+                    item["_category"] = category["name"]
+                organic_lists.append(category_results)
                 
-                # Use the base execute method
-                result = await self.execute(category_params)
+                search_metadata["successful_searches"] += 1
+                search_metadata["total_results"] += len(category_results)
+                search_metadata["categories_searched"].append(category["name"])
                 
-                if result.get("success", False):
-                    # Add category metadata to results
-                    category_results = result.get("raw_results", {}).get("organic", [])
-                    for item in category_results:
-                        item["_category"] = category["name"]
-                        item["_source_category"] = category["name"]
-                    
-                    all_results.extend(category_results)
-                    search_metadata["successful_searches"] += 1
-                    search_metadata["total_results"] += len(category_results)
-                    search_metadata["categories_searched"].append(category["name"])
-                    
-                    self.logger.info(f"Category {category['name']} search successful: {len(category_results)} results")
-                else:
-                    search_metadata["failed_searches"] += 1
-                    self.logger.warning(f"Category {category['name']} search failed: {result.get('error', 'Unknown error')}")
-                    
-            except Exception as e:
+                self.logger.info(
+                    "Category %s search successful: %d results", category["name"], len(category_results)
+                )
+            elif result.get("exception", False):
                 search_metadata["failed_searches"] += 1
-                self.logger.error(f"Error in category {category['name']} search: {str(e)}")
+                self.logger.error("Error in category %s search: %s", category["name"], result["error"])
+            else:
+                search_metadata["failed_searches"] += 1
+                self.logger.warning(
+                    "Category %s search failed: %s", category["name"], result.get("error", "Unknown error")
+                )
+        
+        # Flatten once, keeping the first result for each normalized link so
+        # cross-posted stories are kept once
+        seen_links: set[str] = set()
+        all_results = [
+            item for item in chain.from_iterable(organic_lists) if _is_new_link(item, seen_links)
+        ]
+        search_metadata["duplicates_skipped"] = search_metadata["total_results"] - len(all_results)
         
         # Return aggregated results
         return {
@@ -729,106 +1044,176 @@ class GoogleSerperTool(BaseTool):
             "total_aggregated_results": len(all_results)
         }
 
-    async def _rate_limit(self):
-        """Implement rate limiting for API requests."""
-        current_time = asyncio.get_event_loop().time()
-        time_since_last = current_time - self.last_request_time
+    async def execute_staggered_search_stream(
+        self, params: dict[str, Any]
+    ) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+        """Run the staggered category searches and yield each result as it finishes.
         
-        if time_since_last < self.request_delay:
-            delay_needed = self.request_delay - time_since_last
-            self.logger.debug(f"Rate limiting: waiting {delay_needed:.2f}s")
-            await asyncio.sleep(delay_needed)
+        Callers can start processing the first categories before the slowest
+        one returns. execute_staggered_search consumes this stream to build its
+        aggregated result.
+        
+        Args:
+            params: Search parameters, as for execute_staggered_search
+            
+        Yields:
+            Tuples of (category name, search result) in completion order. A search
+            that raised yields a failure result marked with "exception".
+        """
+        base_query = params["query"].strip()
+        num_results = params.get("num_results", 5)
+        search_type = params.get("search_type", "search")
+        country = params.get("country", "us")
+        language = params.get("language", "en")
+        max_searches = params.get("max_searches", 18)
+        
+        website_categories = _WEBSITE_CATEGORIES[:max_searches]
+        category_queries = [
+            f"({base_query}) ({category['site_filter']})" for category in website_categories
+        ]
+        
+        if params.get("batch", False):
+            # Send every category query to Serper in one request
+            batch_results = await self._execute_batch(
+                category_queries, num_results, search_type, country, language
+            )
+            for category, result in zip(website_categories, batch_results):
+                yield category["name"], result
+            return
+        
+        semaphore = asyncio.Semaphore(self.max_concurrent_searches)
+        
+        async def run_category(category_query: str) -> dict[str, Any]:
+            """Run one category-filtered search, bounded by the semaphore."""
+            async with semaphore:
+                # Use the base execute method (which applies rate limiting). Sites are
+                # already filtered by the category query, so skip additional filtering.
+                return await self._execute_with_retry({
+                    "query": category_query,
+                    "num_results": num_results,
+                    "search_type": search_type,
+                    "country": country,
+                    "language": language,
+                    "filter_sites": False
+                })
+        
+        task_names = {
+            asyncio.create_task(run_category(category_query)): category["name"]
+            for category, category_query in zip(website_categories, category_queries)
+        }
+        pending = set(task_names)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    # Unpack the finished task instead of re-raising its exception
+                    error = task.exception()
+                    if error is not None:
+                        yield task_names[task], {"error": repr(error), "success": False, "exception": True}
+                    else:
+                        yield task_names[task], task.result()
+        finally:
+            # Stop outstanding searches if the caller stops consuming early
+            for task in pending:
+                task.cancel()
+
+    async def _execute_with_retry(self, params: dict[str, Any]) -> dict[str, Any]:
+        """Execute a search, retrying transient Serper failures.
+        
+        Searches that fail with HTTP 429 or a 5xx status are retried up to
+        max_retries times. Each wait is a random delay between retry_backoff_min
+        and an exponentially growing cap, bounded by retry_backoff_max. Other
+        failures are returned straight away.
+        
+        Args:
+            params: Search parameters passed to execute
+            
+        Returns:
+            Search result dictionary with the number of retries used under "retries"
+        """
+        retries = 0
+        while True:
+            result = await self.execute(params)
+            status = result.get("http_status")
+            retryable = status is not None and (status == 429 or status >= 500)
+            if result.get("success", False) or not retryable or retries >= self.max_retries:
+                break
+            
+            retries += 1
+            delay = random.uniform(
+                self.retry_backoff_min,
+                min(self.retry_backoff_max, self.retry_backoff_min * 2 ** retries)
+            )
+            self.logger.warning(
+                "Retrying '%s' after HTTP %d (attempt %d of %d) in %.2fs",
+                params["query"], status, retries, self.max_retries, delay
+            )
+            await asyncio.sleep(delay)
+        
+        result["retries"] = retries
+        return result
+
+    async def _rate_limit(self) -> None:
+        """Implement token-bucket rate limiting for API requests.
+        
+        Tokens refill at max_requests_per_minute per minute up to rate_limit_burst.
+        A caller that finds the bucket empty reserves the next token and sleeps
+        until it is due. The bucket is read and updated without awaiting in
+        between, so concurrent coroutines never claim the same token.
+        """
+        now = time.monotonic()
+        if self._last_refill is None:
+            self._last_refill = now
+        
+        refill_rate = self.max_requests_per_minute / 60.0
+        self._tokens = min(
+            float(self.rate_limit_burst),
+            self._tokens + (now - self._last_refill) * refill_rate
+        )
+        self._last_refill = now
+        self._tokens -= 1
         
-        self.last_request_time = asyncio.get_event_loop().time()
+        if self._tokens < 0:
+            delay_needed = -self._tokens / refill_rate
+            self.logger.debug("Rate limiting: waiting %.2fs", delay_needed)
+            await asyncio.sleep(delay_needed)
 
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Sequence[str]:
         """Get a list of capabilities this tool provides.
         
         Returns:
-            List of capability strings
+            Immutable sequence of capability strings
         """
-        return [
-            "web_search",
-            "news_search", 
-            "image_search",
-            "video_search",
-            "knowledge_graph",
-            "related_questions",
-            "staggered_comprehensive_search"
-        ]
+        return self._CAPABILITIES
 
-    def get_required_params(self) -> List[str]:
+    def get_required_params(self) -> Sequence[str]:
         """Get a list of required parameters for this tool.
         
         Returns:
-            List of required parameter names
+            Immutable sequence of required parameter names
         """
-        return ["query"]
+        return self._REQUIRED_PARAMS
 
-    def get_optional_params(self) -> List[str]:
+    def get_optional_params(self) -> Sequence[str]:
         """Get a list of optional parameters for this tool.
         
         Returns:
-            List of optional parameter names
+            Immutable sequence of optional parameter names
         """
-        return [
-            "num_results",
-            "search_type",
-            "country",
-            "language",
-            "filter_sites"
-        ]
+        return self._OPTIONAL_PARAMS
 
-    def get_example_usage(self) -> Dict[str, Any]:
+    def get_example_usage(self) -> dict[str, Any]:
         """Get an example of how to use this tool.
         
         Returns:
             Dictionary with example parameters and expected output
         """
-        return {
-            "description": "Perform a web search using Google Serper API",
-            "params": {
-                "query": "latest stock market news",
-                "num_results": 10,
-                "search_type": "news",
-                "country": "us",
-                "language": "en"
-            },
-            "expected_output": {
-                "query": "latest stock market news",
-                "search_type": "news",
-                "num_results": 10,
-                "organic_results": "List of news articles",
-                "success": True
-            }
-        }
+        return copy.deepcopy(_EXAMPLE_USAGE)
     
-    def get_staggered_search_example(self) -> Dict[str, Any]:
+    def get_staggered_search_example(self) -> dict[str, Any]:
         """Get an example of how to use the staggered comprehensive search.
         
         Returns:
             Dictionary with example parameters and expected output
         """
-        return {
-            "description": "Perform a comprehensive staggered search across all financial websites",
-            "method": "execute_staggered_search",
-            "params": {
-                "query": "Apple stock analysis Q4 2024",
-                "num_results": 5,
-                "search_type": "search",
-                "max_searches": 18,
-                "country": "us",
-                "language": "en"
-            },
-            "expected_output": {
-                "query": "Apple stock analysis Q4 2024",
-                "staggered_search": True,
-                "search_metadata": {
-                    "total_searches": 18,
-                    "successful_searches": "Number of successful category searches",
-                    "total_results": "Total aggregated results from all sources"
-                },
-                "all_results": "Comprehensive results from 100+ financial websites",
-                "success": True
-            }
-        }
+        return copy.deepcopy(_STAGGERED_SEARCH_EXAMPLE)
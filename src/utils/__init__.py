@@ -0,0 +1,5 @@
+"""Shared utilities for Morning Stock Screener."""
+
+from .serialization import JSON_OPTIONS, dump_json
+
+__all__ = ["JSON_OPTIONS", "dump_json"]
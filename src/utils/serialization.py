@@ -0,0 +1,30 @@
+"""JSON serialization shared by agent and tool output writers."""
+
+from typing import Any
+
+import orjson
+
+# Indented, newline-terminated output that matches the earlier json.dump files:
+# nested datetimes fall through to str() rather than orjson's ISO format, and
+# non-string dict keys are stringified
+JSON_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_APPEND_NEWLINE
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_NON_STR_KEYS
+)
+
+
+def dump_json(payload: Any) -> bytes:
+    """Serialize a payload for an output file.
+
+    The whole document is encoded in memory before it is written; orjson is
+    fast enough on these payloads that this beats streaming with iterencode.
+
+    Args:
+        payload: JSON-compatible data; unsupported values are written via str()
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    return orjson.dumps(payload, default=str, option=JSON_OPTIONS)
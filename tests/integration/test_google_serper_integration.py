@@ -1,9 +1,17 @@
 """Integration tests for GoogleSerperTool with real API calls."""
 
-import pytest
+import asyncio
 import os
+import re
+
+import pytest
+
 from src.tools.google_serper import GoogleSerperTool
 
+# Any of these terms in a snippet counts as financial content; one
+# case-insensitive pass replaces lowering and scanning each term separately
+_FIN_RE = re.compile(r"s&p|stock|market|index|performance", re.IGNORECASE)
+
 
 class TestGoogleSerperIntegration:
     """Integration tests for GoogleSerperTool with real Serper API."""
@@ -14,7 +22,6 @@ class TestGoogleSerperIntegration:
         if not os.getenv('SERPER_API_KEY'):
             pytest.skip("SERPER_API_KEY not found - skipping integration tests")
 
-    @pytest.mark.asyncio
     async def test_real_web_search(self):
         """Test real web search with Serper API."""
         tool = GoogleSerperTool()
@@ -44,7 +51,6 @@ class TestGoogleSerperIntegration:
         assert first_result["title"] != ""
         assert first_result["link"].startswith("http")
 
-    @pytest.mark.asyncio
     async def test_real_news_search(self):
         """Test real news search with Serper API."""
         tool = GoogleSerperTool()
@@ -71,7 +77,6 @@ class TestGoogleSerperIntegration:
         assert "link" in first_result
         assert "snippet" in first_result
 
-    @pytest.mark.asyncio
     async def test_real_financial_search(self):
         """Test real financial search with Serper API."""
         tool = GoogleSerperTool()
@@ -91,62 +96,63 @@ class TestGoogleSerperIntegration:
         # Check if we got financial data
         found_financial_content = False
         for organic_result in result["organic_results"]:
-            if any(term in organic_result["snippet"].lower() 
-                   for term in ["s&p", "stock", "market", "index", "performance"]):
+            if _FIN_RE.search(organic_result["snippet"]):
                 found_financial_content = True
                 break
         
         assert found_financial_content, "Expected financial content in search results"
 
-    @pytest.mark.asyncio
     async def test_search_modalities(self):
         """Test different search modalities as required by the plan."""
         tool = GoogleSerperTool()
         
-        # Test 1: General web search
-        web_result = await tool.run({
-            "query": "Tesla stock analysis",
-            "search_type": "search",
-            "num_results": 2
-        })
+        # The three searches are independent, so overlap their round-trips
+        web_result, news_result, uk_result = await asyncio.gather(
+            # Test 1: General web search
+            tool.run({
+                "query": "Tesla stock analysis",
+                "search_type": "search",
+                "num_results": 2
+            }),
+            # Test 2: News search
+            tool.run({
+                "query": "Tesla earnings report",
+                "search_type": "news",
+                "num_results": 2
+            }),
+            # Test 3: Different countries/languages
+            tool.run({
+                "query": "FTSE 100 index",
+                "search_type": "search",
+                "country": "uk",
+                "language": "en",
+                "num_results": 2
+            })
+        )
+        
         assert web_result["success"] is True
         assert web_result["search_type"] == "search"
         
-        # Test 2: News search
-        news_result = await tool.run({
-            "query": "Tesla earnings report",
-            "search_type": "news",
-            "num_results": 2
-        })
         assert news_result["success"] is True
         assert news_result["search_type"] == "news"
         
-        # Test 3: Different countries/languages
-        uk_result = await tool.run({
-            "query": "FTSE 100 index",
-            "search_type": "search",
-            "country": "uk",
-            "language": "en",
-            "num_results": 2
-        })
         assert uk_result["success"] is True
         assert uk_result["country"] == "uk"
         
         print("✅ All search modalities working correctly!")
 
-    @pytest.mark.asyncio
     async def test_rate_limiting(self):
         """Test that rate limiting works in practice."""
         tool = GoogleSerperTool()
         
-        # Make multiple rapid requests
-        results = []
-        for i in range(3):
-            result = await tool.run({
+        # Fire the requests together; the token bucket spaces them out as needed
+        results = await asyncio.gather(*(
+            tool.run({
                 "query": f"test query {i}",
                 "num_results": 1
             })
-            results.append(result)
+            for i in range(3)
+        ))
         
         # All should succeed (rate limiting should handle the delays)
         for result in results:
@@ -154,7 +160,6 @@ class TestGoogleSerperIntegration:
         
         print("✅ Rate limiting working correctly!")
 
-    @pytest.mark.asyncio
     async def test_error_handling(self):
         """Test error handling with invalid queries."""
         tool = GoogleSerperTool()
@@ -1,14 +1,25 @@
 """Unit tests for BaseAgent class."""
 
-import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from pathlib import Path
 import json
 from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
 
 from src.agents.base import BaseAgent
 from src.llm import OpenAIWrapper
-from src.models.llm import LLMRequest, LLMResponse
+from src.models.llm import LLMResponse
+
+
+@pytest.fixture(scope="module")
+def mock_llm():
+    """Shared specced LLM wrapper for tests that never configure it.
+    
+    Building a spec'd Mock walks the spec class, so do it once per module.
+    Tests that stub generate_response create their own mock instead.
+    """
+    return Mock(spec=OpenAIWrapper)
 
 
 class MockAgent(BaseAgent):
@@ -30,9 +41,8 @@ class MockAgent(BaseAgent):
 class TestBaseAgent:
     """Test BaseAgent functionality."""
 
-    def test_initialization(self):
+    def test_initialization(self, mock_llm):
         """Test agent initialization."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         assert agent.name == "TestAgent"
@@ -40,17 +50,15 @@ class TestBaseAgent:
         assert agent.output_dir == Path("tmp")
         assert agent.logger.name == "agent.TestAgent"
 
-    def test_initialization_with_custom_output_dir(self):
+    def test_initialization_with_custom_output_dir(self, mock_llm):
         """Test agent initialization with custom output directory."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         custom_dir = Path("custom_output")
         agent = MockAgent("TestAgent", mock_llm, custom_dir)
         
         assert agent.output_dir == custom_dir
 
-    def test_validate_input_abstract_method(self):
+    def test_validate_input_abstract_method(self, mock_llm):
         """Test that validate_input is properly abstract."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         # Should work with valid context
@@ -59,10 +67,8 @@ class TestBaseAgent:
         # Should fail with invalid context
         assert agent.validate_input({"wrong_key": "value"}) is False
 
-    @pytest.mark.asyncio
-    async def test_execute_abstract_method(self):
+    async def test_execute_abstract_method(self, mock_llm):
         """Test that execute method works correctly."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         context = {"test_key": "value"}
@@ -71,9 +77,8 @@ class TestBaseAgent:
         assert result["result"] == "mock_result"
         assert result["context"] == context
 
-    def test_process_output_abstract_method(self):
+    def test_process_output_abstract_method(self, mock_llm):
         """Test that process_output method works correctly."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         raw_output = {"data": "test"}
@@ -82,7 +87,6 @@ class TestBaseAgent:
         assert processed["data"] == "test"
         assert processed["processed"] is True
 
-    @pytest.mark.asyncio
     async def test_generate_llm_response(self):
         """Test LLM response generation."""
         mock_llm = Mock(spec=OpenAIWrapper)
@@ -111,9 +115,8 @@ class TestBaseAgent:
         assert call_args.temperature == 0.5
         assert call_args.max_tokens == 1000
 
-    def test_save_raw_output_dict(self, tmp_path):
+    def test_save_raw_output_dict(self, mock_llm, tmp_path):
         """Test saving dictionary output."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm, output_dir=tmp_path)
         
         output_data = {"key": "value", "number": 42}
@@ -134,9 +137,8 @@ class TestBaseAgent:
         assert saved_data["stage"] == "market"
         assert saved_data["data"] == output_data
 
-    def test_save_raw_output_non_dict(self, tmp_path):
+    def test_save_raw_output_non_dict(self, mock_llm, tmp_path):
         """Test saving non-dictionary output."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm, output_dir=tmp_path)
         
         output_data = "Simple string output"
@@ -151,9 +153,27 @@ class TestBaseAgent:
         assert saved_data["data"] == "Simple string output"
         assert saved_data["stage"] == "news"
 
-    def test_save_raw_output_auto_timestamp(self, tmp_path):
+    def test_save_raw_output_nested_unicode(self, mock_llm, tmp_path):
+        """Test nested, non-ASCII output is streamed as valid UTF-8 JSON."""
+        agent = MockAgent("TestAgent", mock_llm, output_dir=tmp_path)
+        
+        output_data = {
+            "queries": [{"query": "Nestlé earnings €", "category": "earnings"}] * 3,
+            "generated_at": datetime(2023, 1, 1, 12, 0, 0),
+        }
+        
+        output_path = agent.save_raw_output(output_data, "news", datetime(2023, 1, 1, 12, 0, 0))
+        
+        raw = output_path.read_text(encoding="utf-8")
+        saved_data = json.loads(raw)
+        
+        assert "Nestlé earnings €" in raw
+        assert saved_data["agent"] == "TestAgent"
+        assert saved_data["data"]["queries"] == output_data["queries"]
+        assert saved_data["data"]["generated_at"] == "2023-01-01 12:00:00"
+
+    def test_save_raw_output_auto_timestamp(self, mock_llm, tmp_path):
         """Test saving output with automatic timestamp."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm, output_dir=tmp_path)
         
         output_data = {"key": "value"}
@@ -165,9 +185,8 @@ class TestBaseAgent:
         # Check filename contains the mocked timestamp
         assert "TestAgent_20230101_120000.json" in str(output_path)
 
-    def test_save_raw_output_creates_directories(self, tmp_path):
+    def test_save_raw_output_creates_directories(self, mock_llm, tmp_path):
         """Test that output directories are created automatically."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm, output_dir=tmp_path)
         
         output_data = {"key": "value"}
@@ -180,10 +199,9 @@ class TestBaseAgent:
         assert stage_dir.exists()
         assert stage_dir.name == "new_stage_outputs"
 
-    def test_log_execution_start(self, caplog):
+    def test_log_execution_start(self, mock_llm, caplog):
         """Test execution start logging."""
         caplog.set_level("DEBUG")
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         context = {"key1": "value1", "key2": "value2"}
@@ -192,10 +210,9 @@ class TestBaseAgent:
         assert "Starting TestAgent execution" in caplog.text
         assert "Input context keys: ['key1', 'key2']" in caplog.text
 
-    def test_log_execution_complete(self, caplog):
+    def test_log_execution_complete(self, mock_llm, caplog):
         """Test execution completion logging."""
         caplog.set_level("DEBUG")
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         output = {"result": "success", "data": "test"}
@@ -204,10 +221,8 @@ class TestBaseAgent:
         assert "Completed TestAgent execution" in caplog.text
         assert "Output keys: ['result', 'data']" in caplog.text
 
-    @pytest.mark.asyncio
-    async def test_run_successful_execution(self):
+    async def test_run_successful_execution(self, mock_llm):
         """Test successful agent execution through run method."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         context = {"test_key": "value"}
@@ -219,10 +234,8 @@ class TestBaseAgent:
         assert result["context"] == context
         assert result["processed"] is True
 
-    @pytest.mark.asyncio
-    async def test_run_validation_failure(self):
+    async def test_run_validation_failure(self, mock_llm):
         """Test run method with validation failure."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         agent = MockAgent("TestAgent", mock_llm)
         
         context = {"wrong_key": "value"}  # Missing test_key
@@ -230,10 +243,8 @@ class TestBaseAgent:
         with pytest.raises(RuntimeError, match="Agent TestAgent execution failed: Invalid input context for TestAgent"):
             await agent.run(context)
 
-    @pytest.mark.asyncio
-    async def test_run_execution_failure(self):
+    async def test_run_execution_failure(self, mock_llm):
         """Test run method with execution failure."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         
         # Create a mock agent that fails during execution
         class FailingAgent(MockAgent):
@@ -246,9 +257,8 @@ class TestBaseAgent:
         with pytest.raises(RuntimeError, match="Agent TestAgent execution failed"):
             await agent.run(context)
 
-    def test_abstract_methods_must_be_implemented(self):
+    def test_abstract_methods_must_be_implemented(self, mock_llm):
         """Test that abstract methods must be implemented."""
-        mock_llm = Mock(spec=OpenAIWrapper)
         
         # This should raise an error because we're not implementing abstract methods
         with pytest.raises(TypeError):
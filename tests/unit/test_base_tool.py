@@ -1,13 +1,17 @@
 """Unit tests for BaseTool class."""
 
-import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from pathlib import Path
-import json
 from datetime import datetime
+from pathlib import Path
+
+import orjson
+import pytest
 
 from src.tools.base import BaseTool
 
+# Fixed save timestamp and the file-name stamp it produces
+FIXED_TS = datetime(2023, 1, 1, 12, 0, 0)
+FIXED_TS_STAMP = "20230101_120000"
+
 
 class MockTool(BaseTool):
     """Concrete implementation of BaseTool for testing."""
@@ -25,16 +29,38 @@ class MockTool(BaseTool):
         return {**raw_output, "formatted": True}
 
 
+class _FailingTool(MockTool):
+    """Tool that fails during execution."""
+    
+    async def execute(self, params):
+        """Raise to simulate an execution failure."""
+        raise RuntimeError("Execution failed")
+
+
+@pytest.fixture(scope="module")
+def shared_tool(tmp_path_factory):
+    """One tool writing to a module-wide temp directory.
+    
+    The save tests write distinct operation names and only read back their own
+    file, so they can share the tool and its output directory.
+    """
+    return MockTool("TestTool", output_dir=tmp_path_factory.mktemp("outputs"))
+
+
+@pytest.fixture(scope="module")
+def default_tool():
+    """Default-configured tool shared by the tests that do not mutate it."""
+    return MockTool("TestTool")
+
+
 class TestBaseTool:
     """Test BaseTool functionality."""
 
-    def test_initialization(self):
+    def test_initialization(self, default_tool):
         """Test tool initialization."""
-        tool = MockTool("TestTool")
-        
-        assert tool.name == "TestTool"
-        assert tool.output_dir == Path("tmp")
-        assert tool.logger.name == "tool.TestTool"
+        assert default_tool.name == "TestTool"
+        assert default_tool.output_dir == Path("tmp")
+        assert default_tool.logger.name == "tool.TestTool"
 
     def test_initialization_with_custom_output_dir(self):
         """Test tool initialization with custom output directory."""
@@ -43,87 +69,88 @@ class TestBaseTool:
         
         assert tool.output_dir == custom_dir
 
-    def test_validate_params_abstract_method(self):
+    def test_validate_params_abstract_method(self, default_tool):
         """Test that validate_params is properly abstract."""
-        tool = MockTool("TestTool")
-        
         # Should work with valid params
-        assert tool.validate_params({"test_key": "value"}) is True
+        assert default_tool.validate_params({"test_key": "value"}) is True
         
         # Should fail with invalid params
-        assert tool.validate_params({"wrong_key": "value"}) is False
+        assert default_tool.validate_params({"wrong_key": "value"}) is False
 
-    @pytest.mark.asyncio
-    async def test_execute_abstract_method(self):
+    async def test_execute_abstract_method(self, default_tool):
         """Test that execute method works correctly."""
-        tool = MockTool("TestTool")
-        
         params = {"test_key": "value"}
-        result = await tool.execute(params)
+        result = await default_tool.execute(params)
         
         assert result["result"] == "mock_result"
         assert result["params"] == params
 
-    def test_format_output_abstract_method(self):
+    def test_format_output_abstract_method(self, default_tool):
         """Test that format_output method works correctly."""
-        tool = MockTool("TestTool")
-        
         raw_output = {"data": "test"}
-        formatted = tool.format_output(raw_output)
+        formatted = default_tool.format_output(raw_output)
         
         assert formatted["data"] == "test"
         assert formatted["formatted"] is True
 
-    def test_save_tool_output_dict(self, tmp_path):
+    def test_save_tool_output_dict(self, shared_tool):
         """Test saving dictionary output."""
-        tool = MockTool("TestTool", output_dir=tmp_path)
-        
         output_data = {"key": "value", "number": 42}
-        timestamp = datetime(2023, 1, 1, 12, 0, 0)
         
-        output_path = tool.save_tool_output(output_data, "search", timestamp)
+        output_path = shared_tool.save_tool_output(output_data, "search", FIXED_TS)
         
         # Check file was created
         assert output_path.exists()
         assert "TestTool_outputs" in str(output_path)
-        assert "search_20230101_120000.json" in str(output_path)
+        assert f"search_{FIXED_TS_STAMP}.json" in str(output_path)
         
         # Check content
-        with open(output_path) as f:
-            saved_data = json.load(f)
+        saved_data = orjson.loads(output_path.read_bytes())
         
         assert saved_data["tool"] == "TestTool"
         assert saved_data["operation"] == "search"
         assert saved_data["data"] == output_data
 
-    def test_save_tool_output_non_dict(self, tmp_path):
+    def test_save_tool_output_non_dict(self, shared_tool):
         """Test saving non-dictionary output."""
-        tool = MockTool("TestTool", output_dir=tmp_path)
-        
         output_data = "Simple string output"
-        timestamp = datetime(2023, 1, 1, 12, 0, 0)
         
-        output_path = tool.save_tool_output(output_data, "process", timestamp)
+        output_path = shared_tool.save_tool_output(output_data, "process", FIXED_TS)
         
         # Check content
-        with open(output_path) as f:
-            saved_data = json.load(f)
+        saved_data = orjson.loads(output_path.read_bytes())
         
         assert saved_data["data"] == "Simple string output"
         assert saved_data["operation"] == "process"
 
-    def test_save_tool_output_auto_timestamp(self, tmp_path):
-        """Test saving output with automatic timestamp."""
-        tool = MockTool("TestTool", output_dir=tmp_path)
+    def test_save_tool_output_registry_shapes(self, shared_tool):
+        """Test tuples, datetimes and non-string keys encode like json.dump did."""
+        output_data = {
+            "queries": ({"query": "Fed decision", "category": "monetary_policy"},),
+            "generated_at": FIXED_TS,
+            "counts": {1: "one"},
+        }
+        
+        output_path = shared_tool.save_tool_output(output_data, "registry", FIXED_TS)
+        saved_data = orjson.loads(output_path.read_bytes())["data"]
         
+        assert saved_data["queries"] == [{"query": "Fed decision", "category": "monetary_policy"}]
+        assert saved_data["generated_at"] == str(FIXED_TS)
+        assert saved_data["counts"] == {"1": "one"}
+
+    def test_save_tool_output_auto_timestamp(self, shared_tool):
+        """Test saving output with automatic timestamp."""
         output_data = {"key": "value"}
         
-        with patch('src.tools.base.datetime') as mock_datetime:
-            mock_datetime.now.return_value = datetime(2023, 1, 1, 12, 0, 0)
-            output_path = tool.save_tool_output(output_data, "fetch")
+        # Bracket the call with the real clock instead of patching datetime
+        before = datetime.now().replace(microsecond=0)
+        output_path = shared_tool.save_tool_output(output_data, "fetch")
+        after = datetime.now()
         
-        # Check filename contains the mocked timestamp
-        assert "fetch_20230101_120000.json" in str(output_path)
+        # Check filename carries a timestamp taken during the call
+        assert output_path.name.startswith("fetch_")
+        stamped = datetime.strptime(output_path.stem, "fetch_%Y%m%d_%H%M%S")
+        assert before <= stamped <= after
 
     def test_save_tool_output_creates_directories(self, tmp_path):
         """Test that output directories are created automatically."""
@@ -139,123 +166,90 @@ class TestBaseTool:
         assert tool_dir.exists()
         assert tool_dir.name == "TestTool_outputs"
 
-    def test_log_execution_start(self, caplog):
-        """Test execution start logging."""
-        caplog.set_level("INFO")
-        tool = MockTool("TestTool")
-        
-        params = {"key1": "value1", "key2": "value2"}
-        tool.log_execution_start(params)
-        
-        assert "Starting TestTool execution" in caplog.text
-
-    def test_log_execution_complete(self, caplog):
-        """Test execution completion logging."""
-        caplog.set_level("INFO")
-        tool = MockTool("TestTool")
-        
-        output = {"result": "success", "data": "test"}
-        tool.log_execution_complete(output)
-        
-        assert "Completed TestTool execution" in caplog.text
-
-    def test_log_error(self, caplog):
-        """Test error logging."""
-        caplog.set_level("ERROR")
-        tool = MockTool("TestTool")
-        
-        error = ValueError("Test error")
-        tool.log_error(error, "test context")
-        
-        assert "Tool TestTool error: Test error" in caplog.text
-        assert "Context: test context" in caplog.text
-
-    @pytest.mark.asyncio
-    async def test_run_successful_execution(self):
+    @pytest.mark.parametrize("level,method,args,expected", [
+        ("INFO", "log_execution_start", ({"key1": "value1", "key2": "value2"},), ["Starting TestTool execution"]),
+        ("INFO", "log_execution_complete", ({"result": "success", "data": "test"},), ["Completed TestTool execution"]),
+        (
+            "ERROR",
+            "log_error",
+            (ValueError("Test error"), "test context"),
+            ["Tool TestTool error: Test error", "Context: test context"]
+        ),
+    ])
+    def test_log(self, default_tool, caplog, level, method, args, expected):
+        """Test execution start, completion and error logging."""
+        caplog.set_level(level)
+        
+        getattr(default_tool, method)(*args)
+        
+        for text in expected:
+            assert text in caplog.text
+
+    async def test_run_successful_execution(self, default_tool):
         """Test successful tool execution through run method."""
-        tool = MockTool("TestTool")
-        
         params = {"test_key": "value", "operation": "search"}
         
-        result = await tool.run(params)
+        result = await default_tool.run(params)
         
         # Check the result contains both execute and format_output results
         assert result["result"] == "mock_result"
         assert result["params"] == params
         assert result["formatted"] is True
 
-    @pytest.mark.asyncio
-    async def test_run_without_saving_output(self):
+    async def test_run_without_saving_output(self, default_tool):
         """Test run method without saving output."""
-        tool = MockTool("TestTool")
-        
         params = {"test_key": "value", "operation": "search"}
         
-        result = await tool.run(params, save_output=False)
+        result = await default_tool.run(params, save_output=False)
         
         # Check the result is still formatted
         assert result["formatted"] is True
 
-    @pytest.mark.asyncio
-    async def test_run_validation_failure(self):
+    async def test_run_validation_failure(self, default_tool):
         """Test run method with validation failure."""
-        tool = MockTool("TestTool")
-        
         params = {"wrong_key": "value"}  # Missing test_key
         
         with pytest.raises(RuntimeError, match="Tool TestTool execution failed: Invalid parameters for TestTool"):
-            await tool.run(params)
+            await default_tool.run(params)
 
-    @pytest.mark.asyncio
     async def test_run_execution_failure(self):
         """Test run method with execution failure."""
-        # Create a mock tool that fails during execution
-        class FailingTool(MockTool):
-            async def execute(self, params):
-                raise RuntimeError("Execution failed")
-        
-        tool = FailingTool("TestTool")
+        tool = _FailingTool("TestTool")
         params = {"test_key": "value"}
         
         with pytest.raises(RuntimeError, match="Tool TestTool execution failed: Execution failed"):
             await tool.run(params)
 
-    def test_get_capabilities(self):
+    def test_get_capabilities(self, default_tool):
         """Test getting tool capabilities."""
-        tool = MockTool("TestTool")
-        
-        capabilities = tool.get_capabilities()
+        capabilities = default_tool.get_capabilities()
         
         assert capabilities == ["TestTool"]
 
-    def test_get_required_params(self):
+    def test_get_required_params(self, default_tool):
         """Test getting required parameters."""
-        tool = MockTool("TestTool")
-        
-        required_params = tool.get_required_params()
+        required_params = default_tool.get_required_params()
         
         assert required_params == []
 
-    def test_get_optional_params(self):
+    def test_get_optional_params(self, default_tool):
         """Test getting optional parameters."""
-        tool = MockTool("TestTool")
-        
-        optional_params = tool.get_optional_params()
+        optional_params = default_tool.get_optional_params()
         
         assert optional_params == []
 
-    def test_get_example_usage(self):
+    def test_get_example_usage(self, default_tool):
         """Test getting example usage."""
-        tool = MockTool("TestTool")
-        
-        example = tool.get_example_usage()
+        example = default_tool.get_example_usage()
         
         assert example["description"] == "Example usage of TestTool"
         assert example["params"] == {}
         assert example["expected_output"] == {}
 
-    def test_abstract_methods_must_be_implemented(self):
-        """Test that abstract methods must be implemented."""
-        # This should raise an error because we're not implementing abstract methods
-        with pytest.raises(TypeError):
-            BaseTool("TestTool")
+
+@pytest.mark.parametrize("abstract_cls", [BaseTool])
+def test_abstract_methods_must_be_implemented(abstract_cls):
+    """Test that abstract tool bases cannot be instantiated."""
+    # This should raise an error because the abstract methods are not implemented
+    with pytest.raises(TypeError):
+        abstract_cls("TestTool")
@@ -1,445 +1,484 @@
 """Unit tests for GoogleSerperTool class."""
 
-import pytest
-from unittest.mock import Mock, AsyncMock, patch, MagicMock
-from pathlib import Path
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
 import httpx
+import orjson
+import pytest
 
 from src.tools.google_serper import GoogleSerperTool
+from src.utils import dump_json
+
+
+def _mock_client(handler):
+    """Build an AsyncClient whose requests are answered in-process by handler."""
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _refuse_connection(request):
+    """Transport handler that fails as if the Serper host refused the connection."""
+    raise httpx.ConnectError("Connection failed", request=request)
+
+
+@pytest.fixture(scope="module")
+def serper_settings():
+    """Patch get_settings once for the whole module with a plain settings object."""
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.setattr(
+        "src.tools.google_serper.get_settings",
+        lambda: SimpleNamespace(serper_api_key="test-api-key")
+    )
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture
+def serper_tool(serper_settings):
+    """Fresh tool per test; its cache, token bucket and client must not leak between tests."""
+    return GoogleSerperTool()
 
 
 class TestGoogleSerperTool:
     """Test GoogleSerperTool functionality."""
 
-    def test_initialization(self):
+    def test_initialization(self, serper_tool):
         """Test tool initialization."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            assert tool.name == "GoogleSerper"
-            assert tool.api_key == "test-api-key"
-            assert tool.base_url == "https://google.serper.dev/search"
-            assert tool.max_requests_per_minute == 100
-
-    def test_validate_params_valid(self):
-        """Test parameter validation with valid parameters."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Valid parameters
-            valid_params = {
-                "query": "test query",
-                "num_results": 10,
-                "search_type": "news",
-                "country": "us",
-                "language": "en"
-            }
-            
-            assert tool.validate_params(valid_params) is True
-
-    def test_validate_params_missing_query(self):
-        """Test parameter validation with missing query."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Missing query
-            invalid_params = {
-                "num_results": 10
-            }
-            
-            assert tool.validate_params(invalid_params) is False
-
-    def test_validate_params_empty_query(self):
-        """Test parameter validation with empty query."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Empty query
-            invalid_params = {
-                "query": "",
-                "num_results": 10
-            }
-            
-            assert tool.validate_params(invalid_params) is False
-
-    def test_validate_params_invalid_num_results(self):
-        """Test parameter validation with invalid num_results."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Invalid num_results
-            invalid_params = {
-                "query": "test query",
-                "num_results": 0  # Must be >= 1
-            }
-            
-            assert tool.validate_params(invalid_params) is False
-            
-            invalid_params = {
-                "query": "test query",
-                "num_results": 101  # Must be <= 100
-            }
-            
-            assert tool.validate_params(invalid_params) is False
+        assert serper_tool.name == "GoogleSerper"
+        assert serper_tool.api_key == "test-api-key"
+        assert serper_tool.base_url == "https://google.serper.dev/search"
+        assert serper_tool.max_requests_per_minute == 100
 
+    @pytest.mark.parametrize("params,expected", [
+        ({"query": "test query", "num_results": 10, "search_type": "news", "country": "us", "language": "en"}, True),
+        ({"num_results": 10}, False),  # Missing query
+        ({"query": "", "num_results": 10}, False),  # Empty query
+        ({"query": "test query", "num_results": 0}, False),  # Must be >= 1
+        ({"query": "test query", "num_results": 101}, False),  # Must be <= 100
+        ({"query": "test query", "num_results": True}, False),  # bool is not an integer count
+    ])
+    def test_validate_params(self, serper_tool, params, expected):
+        """Test parameter validation for valid and invalid query/num_results combinations."""
+        assert serper_tool.validate_params(params) is expected
 
+    @pytest.mark.parametrize("handler,expected_error,expected_status", [
+        (lambda request: httpx.Response(400, text="Bad Request"), "HTTP error 400", 400),
+        (_refuse_connection, "Request error", None),
+    ], ids=["http_error", "request_error"])
+    async def test_execute_transport_errors(self, serper_tool, handler, expected_error, expected_status):
+        """Test HTTP status and connection errors become failure results."""
+        serper_tool._client = _mock_client(handler)
+        
+        result = await serper_tool.execute({"query": "test query"})
+        await serper_tool.aclose()
+        
+        assert result["success"] is False
+        assert expected_error in result["error"]
+        assert result.get("http_status") == expected_status
 
-    @pytest.mark.asyncio
-    async def test_execute_successful_search_simple(self):
-        """Test successful search execution with simplified mocking."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Mock the entire execute method to avoid async complexity
-            async def mock_execute(params):
-                return {
-                    "query": params["query"],
-                    "search_type": params.get("search_type", "search"),
-                    "num_results": params.get("num_results", 10),
-                    "country": params.get("country", "us"),
-                    "language": params.get("language", "en"),
-                    "raw_results": {
-                        "organic": [
-                            {
-                                "title": "Test Result",
-                                "link": "https://example.com",
-                                "snippet": "This is a test result"
-                            }
-                        ]
-                    },
-                    "success": True
-                }
-            
-            with patch.object(tool, 'execute', side_effect=mock_execute):
-                params = {
-                    "query": "test query",
-                    "num_results": 1,
-                    "search_type": "search"
-                }
-                
-                result = await tool.execute(params)
-                
-                assert result["success"] is True
-                assert result["query"] == "test query"
-                assert result["search_type"] == "search"
-                assert result["num_results"] == 1
-                assert "raw_results" in result
-
-
-
-    @pytest.mark.asyncio
-    async def test_execute_news_search_simple(self):
-        """Test news search execution with simplified mocking."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Mock the entire execute method to avoid async complexity
-            async def mock_execute(params):
-                return {
-                    "query": params["query"],
-                    "search_type": params.get("search_type", "search"),
-                    "num_results": params.get("num_results", 10),
-                    "country": params.get("country", "us"),
-                    "language": params.get("language", "en"),
-                    "raw_results": {
-                        "organic": [
-                            {
-                                "title": "News Article",
-                                "link": "https://news.com",
-                                "snippet": "This is a news article"
-                            }
-                        ]
-                    },
-                    "success": True
-                }
-            
-            with patch.object(tool, 'execute', side_effect=mock_execute):
-                params = {
-                    "query": "stock market news",
-                    "search_type": "news"
-                }
-                
-                result = await tool.execute(params)
-                
-                assert result["success"] is True
-                assert result["search_type"] == "news"
-
-    @pytest.mark.asyncio
-    async def test_execute_http_error(self):
-        """Test search execution with HTTP error."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Mock HTTP error
-            mock_response = Mock()
-            mock_response.status_code = 400
-            mock_response.text = "Bad Request"
-            
-            http_error = httpx.HTTPStatusError("Bad Request", request=Mock(), response=mock_response)
-            
-            # Mock httpx client
-            with patch('httpx.AsyncClient') as mock_client_class:
-                mock_client = Mock()
-                mock_client_class.return_value.__aenter__.return_value = mock_client
-                mock_client.post.side_effect = http_error
-                
-                params = {"query": "test query"}
-                
-                result = await tool.execute(params)
-                
-                assert result["success"] is False
-                assert "HTTP error 400" in result["error"]
-                assert result["http_status"] == 400
-
-    @pytest.mark.asyncio
-    async def test_execute_request_error(self):
-        """Test search execution with request error."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Mock request error
-            request_error = httpx.RequestError("Connection failed", request=Mock())
-            
-            # Mock httpx client
-            with patch('httpx.AsyncClient') as mock_client_class:
-                mock_client = Mock()
-                mock_client_class.return_value.__aenter__.return_value = mock_client
-                mock_client.post.side_effect = request_error
-                
-                params = {"query": "test query"}
-                
-                result = await tool.execute(params)
-                
-                assert result["success"] is False
-                assert "Request error" in result["error"]
-
-    def test_format_output_successful(self):
+    async def test_execute_caches_successful_results(self, serper_tool):
+        """Test repeated searches are served from the TTL cache."""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, content=b'{"organic": [{"title": "Result"}]}')
+        
+        serper_tool._client = _mock_client(handler)
+        
+        params = {"query": "test query", "filter_sites": False}
+        
+        first = await serper_tool.execute(params)
+        second = await serper_tool.execute(params)
+        
+        assert len(requests) == 1
+        assert orjson.loads(requests[0].content)["q"] == "test query"
+        assert "cache_hit" not in first
+        assert second["cache_hit"] is True
+        assert second["raw_results"] == first["raw_results"]
+        
+        # Cached copies are independent of what callers mutate
+        second["raw_results"]["organic"].clear()
+        third = await serper_tool.execute(params)
+        assert third["raw_results"]["organic"] == [{"title": "Result"}]
+        
+        # Expired entries go back to the API
+        serper_tool.cache_ttl_seconds = 0
+        await serper_tool.execute({"query": "other query", "filter_sites": False})
+        await serper_tool.execute({"query": "other query", "filter_sites": False})
+        assert len(requests) == 3
+        await serper_tool.aclose()
+
+    async def test_execute_rejects_oversized_response(self, serper_tool):
+        """Test streamed bodies over max_response_bytes fail the search."""
+        serper_tool.max_response_bytes = 8
+        serper_tool._client = _mock_client(
+            lambda request: httpx.Response(200, content=b'{"organic": []}')
+        )
+        
+        result = await serper_tool.execute({"query": "test query"})
+        await serper_tool.aclose()
+        
+        assert result["success"] is False
+        assert "exceeded 8 bytes" in result["error"]
+
+    async def test_http_client_is_reused_and_closed(self, serper_tool):
+        """Test the shared HTTP client is created once and closed by aclose."""
+        client = serper_tool._get_client()
+        assert serper_tool._get_client() is client
+        
+        await serper_tool.aclose()
+        assert client.is_closed
+        assert serper_tool._client is None
+        assert serper_tool._get_client() is not client
+        await serper_tool.aclose()
+
+    def test_http_client_uses_http2_when_available(self, serper_tool):
+        """Test the shared client enables HTTP/2 with a small pool when h2 is installed."""
+        with patch('src.tools.google_serper._HTTP2_AVAILABLE', True), \
+             patch('httpx.AsyncClient') as mock_client_class:
+            serper_tool._get_client()
+            
+            kwargs = mock_client_class.call_args.kwargs
+            assert kwargs["http2"] is True
+            assert kwargs["limits"].max_connections == 4
+
+    def test_build_payload_search_types(self, serper_tool):
+        """Test search types map to Serper's tbm parameter."""
+        assert serper_tool._build_payload("q", 10, "news", "us", "en")["tbm"] == "nws"
+        assert serper_tool._build_payload("q", 10, "images", "us", "en")["tbm"] == "isch"
+        assert serper_tool._build_payload("q", 10, "videos", "us", "en")["tbm"] == "vid"
+        assert "tbm" not in serper_tool._build_payload("q", 10, "search", "us", "en")
+        assert serper_tool._build_payload("q", 500, "search", "us", "en")["num"] == 100
+
+    def test_format_output_successful(self, serper_tool):
         """Test output formatting for successful search."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            raw_output = {
-                "success": True,
-                "query": "test query",
-                "search_type": "search",
-                "num_results": 2,
-                "country": "us",
-                "language": "en",
-                "raw_results": {
-                    "organic": [
-                        {
-                            "title": "Result 1",
-                            "link": "https://example1.com",
-                            "snippet": "Snippet 1",
-                            "position": 1
-                        },
-                        {
-                            "title": "Result 2",
-                            "link": "https://example2.com", 
-                            "snippet": "Snippet 2",
-                            "position": 2
-                        }
-                    ],
-                    "knowledgeGraph": {
-                        "title": "Test Knowledge",
-                        "type": "Test Type",
-                        "description": "Test Description"
+        raw_output = {
+            "success": True,
+            "query": "test query",
+            "search_type": "search",
+            "num_results": 2,
+            "country": "us",
+            "language": "en",
+            "raw_results": {
+                "organic": [
+                    {
+                        "title": "Result 1",
+                        "link": "https://example1.com",
+                        "snippet": "Snippet 1",
+                        "position": 1,
+                        "sitelinks": [{"title": "About", "link": "https://example1.com/about"}]
                     },
-                    "relatedQuestions": [
-                        {
-                            "question": "Test Question?",
-                            "answer": "Test Answer",
-                            "source": "Test Source"
-                        }
-                    ],
-                    "searchTime": 0.5,
-                    "searchInformation": {
-                        "totalResults": "1000"
+                    {
+                        "title": "Result 2",
+                        "link": "https://example2.com", 
+                        "snippet": "Snippet 2",
+                        "position": 2
+                    }
+                ],
+                "knowledgeGraph": {
+                    "title": "Test Knowledge",
+                    "type": "Test Type",
+                    "description": "Test Description"
+                },
+                "relatedQuestions": [
+                    {
+                        "question": "Test Question?",
+                        "answer": "Test Answer",
+                        "source": "Test Source"
                     }
+                ],
+                "searchTime": 0.5,
+                "searchInformation": {
+                    "totalResults": "1000"
                 }
             }
-            
-            formatted = tool.format_output(raw_output)
-            
-            assert formatted["success"] is True
-            assert formatted["query"] == "test query"
-            assert formatted["total_results"] == 2
-            assert len(formatted["organic_results"]) == 2
-            assert formatted["knowledge_graph"]["title"] == "Test Knowledge"
-            assert len(formatted["related_questions"]) == 1
-            assert formatted["search_metadata"]["search_time"] == 0.5
-
-    def test_format_output_failed(self):
+        }
+        
+        formatted = serper_tool.format_output(raw_output)
+        
+        assert formatted["success"] is True
+        assert formatted["query"] == "test query"
+        assert formatted["total_results"] == 2
+        assert len(formatted["organic_results"]) == 2
+        assert formatted["organic_results"][0]["sitelinks"][0]["title"] == "About"
+        assert "sitelinks" not in formatted["organic_results"][1]
+        assert formatted["knowledge_graph"]["title"] == "Test Knowledge"
+        assert len(formatted["related_questions"]) == 1
+        assert formatted["search_metadata"]["search_time"] == 0.5
+
+    def test_format_output_failed(self, serper_tool):
         """Test output formatting for failed search."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            raw_output = {
-                "success": False,
-                "query": "test query",
-                "error": "Test error"
-            }
-            
-            formatted = tool.format_output(raw_output)
-            
-            # Should return the raw output unchanged for failed searches
-            assert formatted == raw_output
+        raw_output = {
+            "success": False,
+            "query": "test query",
+            "error": "Test error"
+        }
+        
+        formatted = serper_tool.format_output(raw_output)
+        
+        # Should return the raw output unchanged for failed searches
+        assert formatted == raw_output
 
-    def test_get_capabilities(self):
+    def test_get_capabilities(self, serper_tool):
         """Test getting tool capabilities."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            capabilities = tool.get_capabilities()
-            
-            expected_capabilities = [
-                "web_search",
-                "news_search",
-                "image_search", 
-                "video_search",
-                "knowledge_graph",
-                "related_questions",
-                "staggered_comprehensive_search"
-            ]
-            
-            assert capabilities == expected_capabilities
+        capabilities = serper_tool.get_capabilities()
+        
+        expected_capabilities = (
+            "web_search",
+            "news_search",
+            "image_search", 
+            "video_search",
+            "knowledge_graph",
+            "related_questions",
+            "staggered_comprehensive_search"
+        )
+        
+        assert capabilities == expected_capabilities
+        assert serper_tool.get_capabilities() is capabilities
 
-    def test_get_required_params(self):
+    def test_get_required_params(self, serper_tool):
         """Test getting required parameters."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            required_params = tool.get_required_params()
-            
-            assert required_params == ["query"]
+        required_params = serper_tool.get_required_params()
+        
+        assert required_params == ("query",)
 
-    def test_get_optional_params(self):
+    def test_get_optional_params(self, serper_tool):
         """Test getting optional parameters."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            optional_params = tool.get_optional_params()
-            
-            expected_params = [
-                "num_results",
-                "search_type",
-                "country", 
-                "language",
-                "filter_sites"
-            ]
-            
-            assert optional_params == expected_params
+        optional_params = serper_tool.get_optional_params()
+        
+        expected_params = (
+            "num_results",
+            "search_type",
+            "country", 
+            "language",
+            "filter_sites"
+        )
+        
+        assert optional_params == expected_params
 
-    def test_get_example_usage(self):
+    def test_get_example_usage(self, serper_tool):
         """Test getting example usage."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            example = tool.get_example_usage()
-            
-            assert example["description"] == "Perform a web search using Google Serper API"
-            assert "query" in example["params"]
-            assert "expected_output" in example
+        example = serper_tool.get_example_usage()
+        
+        assert example["description"] == "Perform a web search using Google Serper API"
+        assert "query" in example["params"]
+        assert "expected_output" in example
+        
+        # Examples are plain dicts that serialize, and each call gets its own copy
+        assert json.loads(json.dumps(example)) == example
+        example["params"]["query"] = "changed"
+        assert serper_tool.get_example_usage()["params"]["query"] == "latest stock market news"
 
-    def test_validate_params_filter_sites_boolean(self):
+    def test_get_staggered_search_example(self, serper_tool):
+        """Test getting the staggered search example."""
+        example = serper_tool.get_staggered_search_example()
+        
+        assert example["method"] == "execute_staggered_search"
+        assert json.loads(json.dumps(example)) == example
+        assert orjson.loads(dump_json(example)) == example
+
+    def test_validate_params_filter_sites_boolean(self, serper_tool):
         """Test that filter_sites parameter accepts boolean values."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Valid boolean values
-            assert tool.validate_params({"query": "test", "filter_sites": True})
-            assert tool.validate_params({"query": "test", "filter_sites": False})
-            
-            # Invalid non-boolean values
-            assert not tool.validate_params({"query": "test", "filter_sites": "yes"})
-            assert not tool.validate_params({"query": "test", "filter_sites": 1})
-            assert not tool.validate_params({"query": "test", "filter_sites": None})
+        # Valid boolean values
+        assert serper_tool.validate_params({"query": "test", "filter_sites": True})
+        assert serper_tool.validate_params({"query": "test", "filter_sites": False})
+        
+        # Invalid non-boolean values
+        assert not serper_tool.validate_params({"query": "test", "filter_sites": "yes"})
+        assert not serper_tool.validate_params({"query": "test", "filter_sites": 1})
+        assert not serper_tool.validate_params({"query": "test", "filter_sites": None})
 
-    @pytest.mark.asyncio
-    async def test_rate_limiting(self):
+    async def test_rate_limiting(self, serper_tool, monkeypatch):
         """Test rate limiting functionality."""
-        with patch('src.tools.google_serper.get_settings') as mock_get_settings:
-            mock_settings = Mock()
-            mock_settings.serper_api_key = "test-api-key"
-            mock_get_settings.return_value = mock_settings
-            
-            tool = GoogleSerperTool()
-            
-            # Mock time to control rate limiting
-            with patch('asyncio.get_event_loop') as mock_loop:
-                mock_loop.return_value.time.return_value = 100.0
-                
-                # First call should not delay
-                await tool._rate_limit()
-                assert tool.last_request_time == 100.0
-                
-                # Second call with small time difference should delay
-                mock_loop.return_value.time.return_value = 100.1  # 0.1s later
-                
-                with patch('asyncio.sleep') as mock_sleep:
-                    await tool._rate_limit()
-                    mock_sleep.assert_called_once()
+        serper_tool.rate_limit_burst = 1
+        serper_tool._tokens = 1.0
+        
+        # Drive the tool's clock by hand; the event loop keeps the real one
+        clock = [100.0]
+        monkeypatch.setattr(
+            "src.tools.google_serper.time", SimpleNamespace(monotonic=lambda: clock[0])
+        )
+        sleeps = []
+        
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+        
+        monkeypatch.setattr("src.tools.google_serper.asyncio.sleep", fake_sleep)
+        
+        # First call should not delay
+        await serper_tool._rate_limit()
+        assert serper_tool._last_refill == 100.0
+        assert sleeps == []
+        
+        # Second call with small time difference should delay
+        clock[0] = 100.1  # 0.1s later
+        await serper_tool._rate_limit()
+        assert sleeps == [pytest.approx(0.5)]
+
+    async def test_rate_limiting_concurrent_callers(self, serper_tool):
+        """Test concurrent callers each reserve their own token."""
+        serper_tool.rate_limit_burst = 2
+        serper_tool._tokens = 2.0
+        
+        with patch('src.tools.google_serper.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            await asyncio.gather(*(serper_tool._rate_limit() for _ in range(5)))
+        
+        # Two requests fit in the burst, the other three wait in turn
+        delays = sorted(call.args[0] for call in mock_sleep.call_args_list)
+        assert len(delays) == 3
+        assert delays == pytest.approx([0.6, 1.2, 1.8], abs=0.05)
+
+    async def test_staggered_search_runs_categories_concurrently(self, serper_tool):
+        """Test staggered search aggregates categories under the concurrency bound."""
+        serper_tool.max_concurrent_searches = 2
+        
+        in_flight = 0
+        max_in_flight = 0
+        
+        async def mock_execute(params):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "cnbc.com" in params["query"]:
+                return {"success": False, "error": "HTTP error 500"}
+            return {
+                "success": True,
+                "raw_results": {
+                    "organic": [{"title": "Result", "link": f"https://example.com/{params['query']}"}]
+                }
+            }
+        
+        serper_tool.execute = mock_execute
+        
+        result = await serper_tool.execute_staggered_search({"query": "test query", "max_searches": 4})
+        
+        assert result["success"] is True
+        assert max_in_flight <= 2
+        assert result["search_metadata"]["total_searches"] == 4
+        assert result["search_metadata"]["successful_searches"] == 3
+        assert result["search_metadata"]["failed_searches"] == 1
+        assert result["search_metadata"]["categories_searched"] == [
+            "data_platforms",
+            "government_central_banks",
+            "economic_research",
+        ]
+        assert result["total_aggregated_results"] == 3
+        assert result["search_metadata"]["duplicates_skipped"] == 0
+
+    async def test_staggered_search_deduplicates_links(self, serper_tool):
+        """Test results cross-posted under several categories are kept once."""
+        async def mock_execute(params):
+            return {
+                "success": True,
+                "raw_results": {
+                    "organic": [
+                        {"title": "Shared", "link": "https://reuters.com/story/"},
+                        {"title": "Shared anchor", "link": "https://reuters.com/story#section"},
+                        {"title": "No link"},
+                        {"title": "Null link", "link": None},
+                    ]
+                }
+            }
+        
+        serper_tool.execute = mock_execute
+        
+        result = await serper_tool.execute_staggered_search({"query": "test query", "max_searches": 3})
+        
+        titles = [item["title"] for item in result["all_results"]]
+        assert titles == ["Shared", "No link", "Null link"] + ["No link", "Null link"] * 2
+        assert result["all_results"][0]["_category"] == "core_financial"
+        assert result["search_metadata"]["duplicates_skipped"] == 5
+        assert result["total_aggregated_results"] == 7
+
+    async def test_staggered_search_batch_sends_one_request(self, serper_tool):
+        """Test batch mode sends all category queries in a single request."""
+        async def mock_post_json(body):
+            return [
+                {"organic": [{"title": "Result", "link": f"https://example.com/{i}"}]}
+                for i in range(len(body))
+            ]
+        
+        serper_tool._post_json = AsyncMock(side_effect=mock_post_json)
+        
+        params = {"query": "test query", "max_searches": 3, "batch": True}
+        result = await serper_tool.execute_staggered_search(params)
+        
+        serper_tool._post_json.assert_awaited_once()
+        payloads = serper_tool._post_json.call_args.args[0]
+        assert len(payloads) == 3
+        assert "site:cnbc.com" in payloads[0]["q"]
+        assert result["search_metadata"]["successful_searches"] == 3
+        assert result["all_results"][1]["_category"] == "data_platforms"
+        
+        # A repeat is answered from the per-category cache
+        await serper_tool.execute_staggered_search(params)
+        serper_tool._post_json.assert_awaited_once()
+
+    async def test_staggered_search_stream_yields_in_completion_order(self, serper_tool):
+        """Test the stream yields each category as soon as its search finishes."""
+        async def mock_execute(params):
+            # The first category is the slowest to answer
+            if "cnbc.com" in params["query"]:
+                await asyncio.sleep(0.05)
+            return {"success": True, "raw_results": {"organic": []}}
+        
+        serper_tool.execute = mock_execute
+        
+        names = [
+            name
+            async for name, _ in serper_tool.execute_staggered_search_stream(
+                {"query": "test query", "max_searches": 3}
+            )
+        ]
+        
+        assert names[-1] == "core_financial"
+        assert sorted(names) == ["core_financial", "data_platforms", "government_central_banks"]
+
+    async def test_staggered_search_retries_transient_errors(self, serper_tool):
+        """Test 429/5xx category failures are retried and 4xx failures are not."""
+        attempts = {}
+        
+        async def mock_execute(params):
+            attempts[params["query"]] = attempts.get(params["query"], 0) + 1
+            if "cnbc.com" in params["query"] and attempts[params["query"]] == 1:
+                return {"success": False, "error": "HTTP error 503", "http_status": 503}
+            if "finviz.com" in params["query"]:
+                return {"success": False, "error": "HTTP error 400", "http_status": 400}
+            return {"success": True, "raw_results": {"organic": []}}
+        
+        serper_tool.execute = mock_execute
+        
+        with patch('src.tools.google_serper.asyncio.sleep', new=AsyncMock()) as mock_sleep:
+            result = await serper_tool.execute_staggered_search({"query": "test query", "max_searches": 2})
+        
+        assert sorted(attempts.values()) == [1, 2]
+        mock_sleep.assert_awaited_once()
+        assert 1.0 <= mock_sleep.call_args.args[0] <= 2.0
+        assert result["search_metadata"]["retries"] == 1
+        assert result["search_metadata"]["categories_searched"] == ["core_financial"]
+        assert result["search_metadata"]["failed_searches"] == 1
+
+    async def test_staggered_search_isolates_raising_categories(self, serper_tool):
+        """Test a category whose search raises is counted as failed without stopping the rest."""
+        async def mock_execute(params):
+            if "cnbc.com" in params["query"]:
+                raise RuntimeError("boom")
+            return {"success": True, "raw_results": {"organic": []}}
+        
+        serper_tool.execute = mock_execute
+        
+        outcomes = {
+            name: result
+            async for name, result in serper_tool.execute_staggered_search_stream(
+                {"query": "test query", "max_searches": 2}
+            )
+        }
+        
+        assert outcomes["core_financial"]["exception"] is True
+        assert "boom" in outcomes["core_financial"]["error"]
+        assert outcomes["data_platforms"]["success"] is True
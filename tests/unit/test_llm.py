@@ -1,6 +1,6 @@
 """Tests for LLM wrapper."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
 
 import pytest
 
@@ -8,6 +8,51 @@ from src.llm import OpenAIWrapper
 from src.models.llm import LLMRequest
 
 
+@pytest.fixture(scope="module")
+def wrapper():
+    """Shared OpenAIWrapper for tests using the default model."""
+    return OpenAIWrapper("test-key")
+
+
+class _AsyncCall:
+    """Async callable double that returns or raises a fixed value and counts awaits."""
+
+    def __init__(self, return_value=None, side_effect=None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.await_count = 0
+
+    async def __call__(self, *args, **kwargs):
+        self.await_count += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+
+def _wrapper_with(create, model="gpt-5", embed=None):
+    """Build a wrapper around a fake client whose completions call is ``create``."""
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create)),
+        embeddings=SimpleNamespace(create=embed),
+    )
+    return OpenAIWrapper("test-key", model, client=client)
+
+
+@pytest.fixture(scope="module")
+def mock_response():
+    """Chat completion response double."""
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(content="Stocks are financial instruments..."),
+                finish_reason="stop",
+            )
+        ],
+        model="gpt-5",
+        usage=SimpleNamespace(total_tokens=150),
+    )
+
+
 class TestOpenAIWrapper:
     """Test OpenAI wrapper implementation."""
 
@@ -21,10 +66,8 @@ class TestOpenAIWrapper:
         assert wrapper.api_key == api_key
         assert wrapper.default_model == model
 
-    def test_validate_request_valid(self):
+    def test_validate_request_valid(self, wrapper):
         """Test request validation with valid request."""
-        wrapper = OpenAIWrapper("test-key")
-
         request = LLMRequest(
             system_prompt="You are helpful",
             user_prompt="Tell me about stocks",
@@ -34,10 +77,8 @@ class TestOpenAIWrapper:
 
         assert wrapper.validate_request(request) is True
 
-    def test_validate_request_invalid(self):
+    def test_validate_request_invalid(self, wrapper):
         """Test request validation with invalid request."""
-        wrapper = OpenAIWrapper("test-key")
-
         # Missing system prompt
         request1 = LLMRequest(
             system_prompt="",
@@ -78,11 +119,14 @@ class TestOpenAIWrapper:
         # Test that valid requests pass validation
         assert wrapper.validate_request(request4) is True
 
-    @pytest.mark.asyncio
-    async def test_generate_response_success(self):
-        """Test successful response generation."""
-        wrapper = OpenAIWrapper("test-key")
+        # Out-of-range values assigned after construction are still rejected
+        request4.temperature = 3.0
+        assert wrapper.validate_request(request4) is False
+        request3.max_tokens = 0
+        assert wrapper.validate_request(request3) is False
 
+    async def test_generate_response_success(self, mock_response):
+        """Test successful response generation."""
         request = LLMRequest(
             system_prompt="You are helpful",
             user_prompt="Tell me about stocks",
@@ -90,33 +134,20 @@ class TestOpenAIWrapper:
             max_tokens=1000,
         )
 
-        # Mock the OpenAI client response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Stocks are financial instruments..."
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.model = "gpt-5"
-        mock_response.usage.total_tokens = 150
-
-        with patch.object(
-            wrapper.client.chat.completions, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = mock_response
-
-            response = await wrapper.generate_response(request)
-
-            assert response.success is True
-            assert response.content == "Stocks are financial instruments..."
-            assert response.model_used == "gpt-5"
-            assert response.tokens_used == 150
-            assert response.finish_reason == "stop"
-            assert response.response_time_ms > 0
-
-    @pytest.mark.asyncio
-    async def test_generate_response_validation_failure(self):
-        """Test response generation with validation failure."""
-        wrapper = OpenAIWrapper("test-key")
+        mock_create = _AsyncCall(return_value=mock_response)
+        wrapper = _wrapper_with(mock_create)
 
+        response = await wrapper.generate_response(request)
+
+        assert response.success is True
+        assert response.content == "Stocks are financial instruments..."
+        assert response.model_used == "gpt-5"
+        assert response.tokens_used == 150
+        assert response.finish_reason == "stop"
+        assert response.response_time_ms > 0
+
+    async def test_generate_response_validation_failure(self, wrapper):
+        """Test response generation with validation failure."""
         request = LLMRequest(
             system_prompt="",  # Invalid - empty system prompt
             user_prompt="Tell me about stocks",
@@ -131,11 +162,8 @@ class TestOpenAIWrapper:
         assert response.error_message == "Invalid request parameters"
         assert response.content == ""
 
-    @pytest.mark.asyncio
     async def test_generate_response_api_error(self):
         """Test response generation with API error."""
-        wrapper = OpenAIWrapper("test-key")
-
         request = LLMRequest(
             system_prompt="You are helpful",
             user_prompt="Tell me about stocks",
@@ -144,95 +172,134 @@ class TestOpenAIWrapper:
         )
 
         # Mock API error
-        with patch.object(
-            wrapper.client.chat.completions, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.side_effect = Exception("API rate limit exceeded")
+        mock_create = _AsyncCall(side_effect=Exception("API rate limit exceeded"))
+        wrapper = _wrapper_with(mock_create)
 
-            response = await wrapper.generate_response(request)
+        response = await wrapper.generate_response(request)
 
-            assert response.success is False
-            assert response.finish_reason == "error"
-            assert "API rate limit exceeded" in response.error_message
-            assert response.content == ""
+        assert response.success is False
+        assert response.finish_reason == "error"
+        assert "API rate limit exceeded" in response.error_message
+        assert response.content == ""
 
-    @pytest.mark.asyncio
-    async def test_generate_chat_response_success(self):
+    async def test_generate_chat_response_success(self, mock_response):
         """Test successful chat response generation."""
-        wrapper = OpenAIWrapper("test-key")
-
         messages = [
             {"role": "system", "content": "You are helpful"},
             {"role": "user", "content": "Tell me about stocks"},
         ]
 
-        # Mock the OpenAI client response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Stocks are financial instruments..."
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.model = "gpt-5"
-        mock_response.usage.total_tokens = 150
-
-        with patch.object(
-            wrapper.client.chat.completions, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = mock_response
-
-            response = await wrapper.generate_chat_response(
-                messages=messages, temperature=0.8, max_tokens=2000
-            )
+        mock_create = _AsyncCall(return_value=mock_response)
+        wrapper = _wrapper_with(mock_create)
 
-            assert response.success is True
-            assert response.content == "Stocks are financial instruments..."
-            assert response.model_used == "gpt-5"
-            assert response.tokens_used == 150
-            assert response.finish_reason == "stop"
-            assert response.response_time_ms > 0
+        response = await wrapper.generate_chat_response(
+            messages=messages, temperature=0.8, max_tokens=2000
+        )
 
-    @pytest.mark.asyncio
-    async def test_generate_chat_response_custom_model(self):
-        """Test chat response generation with custom model."""
-        wrapper = OpenAIWrapper("test-key", "gpt-3.5-turbo")
+        assert response.success is True
+        assert response.content == "Stocks are financial instruments..."
+        assert response.model_used == "gpt-5"
+        assert response.tokens_used == 150
+        assert response.finish_reason == "stop"
+        assert response.response_time_ms > 0
 
+    async def test_generate_chat_response_custom_model(self, mock_response):
+        """Test chat response generation with custom model."""
         messages = [{"role": "user", "content": "Hello"}]
 
-        # Mock the OpenAI client response
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock()]
-        mock_response.choices[0].message.content = "Hello! How can I help you?"
-        mock_response.choices[0].finish_reason = "stop"
-        mock_response.model = "gpt-5"
-        mock_response.usage.total_tokens = 50
-
-        with patch.object(
-            wrapper.client.chat.completions, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.return_value = mock_response
-
-            response = await wrapper.generate_chat_response(
-                messages=messages, model="gpt-5"  # Override default model
-            )
+        mock_create = _AsyncCall(return_value=mock_response)
+        wrapper = _wrapper_with(mock_create, "gpt-3.5-turbo")
 
-            assert response.success is True
-            assert response.model_used == "gpt-5"
+        response = await wrapper.generate_chat_response(
+            messages=messages, model="gpt-5"  # Override default model
+        )
+
+        assert response.success is True
+        assert response.model_used == "gpt-5"
 
-    @pytest.mark.asyncio
     async def test_generate_chat_response_error(self):
         """Test chat response generation with error."""
-        wrapper = OpenAIWrapper("test-key")
-
         messages = [{"role": "user", "content": "Hello"}]
 
         # Mock API error
-        with patch.object(
-            wrapper.client.chat.completions, "create", new_callable=AsyncMock
-        ) as mock_create:
-            mock_create.side_effect = Exception("Network error")
+        mock_create = _AsyncCall(side_effect=Exception("Network error"))
+        wrapper = _wrapper_with(mock_create)
+
+        response = await wrapper.generate_chat_response(messages)
+
+        assert response.success is False
+        assert response.finish_reason == "error"
+        assert "Network error" in response.error_message
+        assert response.content == ""
+
+    async def test_generate_response_cache(self, mock_response):
+        """Test deterministic requests are served from cache on repeat."""
+        request = LLMRequest(
+            system_prompt="You are helpful",
+            user_prompt="Tell me about stocks",
+            temperature=0.0,
+            max_tokens=1000,
+            model="gpt-4o",
+        )
+
+        mock_create = _AsyncCall(return_value=mock_response)
+        wrapper = _wrapper_with(mock_create, "gpt-4o")
+
+        first = await wrapper.generate_response(request)
+        second = await wrapper.generate_response(request)
+
+        assert mock_create.await_count == 1
+        assert first.cache_hit is False
+        assert second.cache_hit is True
+        assert second.content == first.content
 
-            response = await wrapper.generate_chat_response(messages)
+        # Sampling requests and GPT-5 (fixed temperature) are never cached
+        await wrapper.generate_response(request.model_copy(update={"temperature": 0.7}))
+        await wrapper.generate_response(request.model_copy(update={"temperature": 0.7}))
+        await wrapper.generate_response(request.model_copy(update={"model": "gpt-5"}))
+        await wrapper.generate_response(request.model_copy(update={"model": "gpt-5"}))
+
+        assert mock_create.await_count == 5
+
+    async def test_semantic_cache_hit(self, mock_response):
+        """Test near-duplicate prompts reuse a cached response when enabled."""
+        vectors = {
+            "Tell me about AAPL stock": [1.0, 0.0, 0.0],
+            "What about AAPL?": [0.99, 0.1, 0.0],
+            "Summarize bond yields": [0.0, 0.0, 1.0],
+        }
+
+        async def embed(model, input):
+            return SimpleNamespace(data=[SimpleNamespace(embedding=vectors[input])])
+
+        mock_create = _AsyncCall(return_value=mock_response)
+        wrapper = _wrapper_with(mock_create, "gpt-4o", embed=embed)
+        wrapper.semantic_cache_threshold = 0.95
+
+        request = LLMRequest(
+            system_prompt="You are helpful",
+            user_prompt="Tell me about AAPL stock",
+            temperature=0.0,
+            model="gpt-4o",
+        )
+
+        await wrapper.generate_response(request)
+        similar = await wrapper.generate_response(
+            request.model_copy(update={"user_prompt": "What about AAPL?"})
+        )
+
+        assert mock_create.await_count == 1
+        assert similar.cache_hit is True
+        assert similar.content == "Stocks are financial instruments..."
+
+        # Dissimilar prompts and different system prompts still reach the API
+        await wrapper.generate_response(
+            request.model_copy(update={"user_prompt": "Summarize bond yields"})
+        )
+        await wrapper.generate_response(
+            request.model_copy(
+                update={"system_prompt": "You are terse", "user_prompt": "What about AAPL?"}
+            )
+        )
 
-            assert response.success is False
-            assert response.finish_reason == "error"
-            assert "Network error" in response.error_message
-            assert response.content == ""
+        assert mock_create.await_count == 3
@@ -1,13 +1,70 @@
 """Tests for data models."""
 
-from decimal import Decimal
-
 import pytest
+from pydantic import ValidationError
 
 from src.models.email import EmailContent, StockEmail
 from src.models.llm import LLMRequest, LLMResponse
 from src.models.market import MacroeconomicNews, MarketConditions
-from src.models.stock import Stock, StockAnalysis, StockRecommendation
+from src.models.stock import (
+    Stock,
+    StockAnalysis,
+    StockRecommendation,
+)
+
+
+@pytest.fixture(scope="module")
+def sample_analysis():
+    """Shared StockAnalysis instance (models are frozen, so safe to reuse)."""
+    return StockAnalysis(
+        fundamental_analysis="Test",
+        technical_analysis="Test",
+        news_analysis="Test",
+        analyst_recommendations="Test",
+        analyst_price_targets="Test",
+        sudden_news="Test",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_recommendation():
+    """Shared StockRecommendation instance."""
+    return StockRecommendation(
+        short_term_reasoning="Test",
+        long_term_reasoning="Test",
+        confidence_score=0.8,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_stock(sample_analysis, sample_recommendation):
+    """Shared Stock instance."""
+    return Stock(
+        name="Test",
+        symbol="TEST",
+        price=100.00,
+        change=1.00,
+        change_percentage=1.00,
+        volume=1000,
+        market_cap=1000000000,
+        industry="Test",
+        analysis=sample_analysis,
+        recommendation=sample_recommendation,
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_conditions():
+    """Shared neutral MarketConditions instance."""
+    return MarketConditions(
+        overall_sentiment="neutral",
+        volatility_level="low",
+        sector_performance={},
+        market_movers=[],
+        key_events=[],
+        economic_indicators={},
+        macro_news=[],
+    )
 
 
 class TestStockModels:
@@ -42,86 +99,129 @@ class TestStockModels:
         assert len(recommendation.risk_factors) == 2
         assert recommendation.confidence_score == 0.85
 
-    def test_stock_creation(self):
-        """Test Stock model creation."""
-        analysis = StockAnalysis(
-            fundamental_analysis="Test",
-            technical_analysis="Test",
-            news_analysis="Test",
-            analyst_recommendations="Test",
-            analyst_price_targets="Test",
-            sudden_news="Test",
-        )
-
+    def test_stock_recommendation_is_frozen(self):
+        """Test StockRecommendation rejects mutation and ignores extra fields."""
         recommendation = StockRecommendation(
             short_term_reasoning="Test",
             long_term_reasoning="Test",
             confidence_score=0.8,
+            unexpected_field="ignored",
         )
 
+        assert not hasattr(recommendation, "unexpected_field")
+        with pytest.raises(ValidationError):
+            recommendation.confidence_score = 0.9
+
+    def test_stock_creation(self, sample_analysis, sample_recommendation):
+        """Test Stock model creation."""
         stock = Stock(
             name="Apple Inc.",
             symbol="AAPL",
-            price=Decimal("150.00"),
-            change=Decimal("2.50"),
-            change_percentage=Decimal("1.67"),
+            price=150.00,
+            change=2.50,
+            change_percentage=1.67,
             volume=1000000,
-            market_cap=Decimal("2500000000000"),
+            market_cap=2500000000000,
             industry="Technology",
-            analysis=analysis,
-            recommendation=recommendation,
+            analysis=sample_analysis,
+            recommendation=sample_recommendation,
         )
 
         assert stock.name == "Apple Inc."
         assert stock.symbol == "AAPL"
-        assert stock.price == Decimal("150.00")
+        assert stock.price == 150.00
         assert stock.industry == "Technology"
 
-    def test_stock_symbol_validation(self):
+    def test_stock_symbol_validation(self, sample_analysis, sample_recommendation):
         """Test stock symbol validation."""
-        analysis = StockAnalysis(
-            fundamental_analysis="Test",
-            technical_analysis="Test",
-            news_analysis="Test",
-            analyst_recommendations="Test",
-            analyst_price_targets="Test",
-            sudden_news="Test",
-        )
-
-        recommendation = StockRecommendation(
-            short_term_reasoning="Test",
-            long_term_reasoning="Test",
-            confidence_score=0.8,
-        )
-
         # Test valid symbol
         stock = Stock(
             name="Test",
             symbol="AAPL",
-            price=Decimal("100.00"),
-            change=Decimal("1.00"),
-            change_percentage=Decimal("1.00"),
+            price=100.00,
+            change=1.00,
+            change_percentage=1.00,
             volume=1000,
-            market_cap=Decimal("1000000000"),
+            market_cap=1000000000,
             industry="Test",
-            analysis=analysis,
-            recommendation=recommendation,
+            analysis=sample_analysis,
+            recommendation=sample_recommendation,
         )
         assert stock.symbol == "AAPL"
 
         # Test invalid symbol
-        with pytest.raises(ValueError, match="Stock symbol must contain only letters"):
+        with pytest.raises(ValidationError, match="should match pattern"):
             Stock(
                 name="Test",
                 symbol="AAPL1",
-                price=Decimal("100.00"),
-                change=Decimal("1.00"),
-                change_percentage=Decimal("1.00"),
+                price=100.00,
+                change=1.00,
+                change_percentage=1.00,
                 volume=1000,
-                market_cap=Decimal("1000000000"),
+                market_cap=1000000000,
                 industry="Test",
-                analysis=analysis,
-                recommendation=recommendation,
+                analysis=sample_analysis,
+                recommendation=sample_recommendation,
+            )
+
+        # Test symbol longer than 6 letters
+        with pytest.raises(ValidationError, match="should match pattern"):
+            Stock(
+                name="Test",
+                symbol="TOOLONG",
+                price=100.00,
+                change=1.00,
+                change_percentage=1.00,
+                volume=1000,
+                market_cap=1000000000,
+                industry="Test",
+                analysis=sample_analysis,
+                recommendation=sample_recommendation,
+            )
+
+    def test_stock_negative_price_validation(self, sample_analysis, sample_recommendation):
+        """Test that negative price and market cap are rejected."""
+        # Negative change is allowed
+        stock = Stock(
+            name="Test",
+            symbol="TEST",
+            price=100.00,
+            change=-1.00,
+            change_percentage=-1.00,
+            volume=1000,
+            market_cap=1000000000,
+            industry="Test",
+            analysis=sample_analysis,
+            recommendation=sample_recommendation,
+        )
+        assert stock.change == -1.00
+
+        with pytest.raises(ValidationError, match="greater than or equal to 0"):
+            Stock(
+                name="Test",
+                symbol="TEST",
+                price=-100.00,
+                change=1.00,
+                change_percentage=1.00,
+                volume=1000,
+                market_cap=1000000000,
+                industry="Test",
+                analysis=sample_analysis,
+                recommendation=sample_recommendation,
+            )
+
+        with pytest.raises(ValidationError, match="market_cap"):
+            Stock(
+                name="Test",
+                symbol="TEST",
+                price=100.00,
+                change=1.00,
+                change_percentage=1.00,
+                volume=1000,
+                market_cap=-1,
+                industry="Test",
+                analysis=sample_analysis,
+                recommendation=sample_recommendation,
             )
 
 
@@ -171,153 +271,36 @@ class TestMarketModels:
 class TestEmailModels:
     """Test email-related models."""
 
-    def test_email_content_creation(self):
+    def test_email_content_creation(self, sample_stock, sample_conditions):
         """Test EmailContent model creation."""
-        # Create mock data
-        analysis = StockAnalysis(
-            fundamental_analysis="Test",
-            technical_analysis="Test",
-            news_analysis="Test",
-            analyst_recommendations="Test",
-            analyst_price_targets="Test",
-            sudden_news="Test",
-        )
-
-        recommendation = StockRecommendation(
-            short_term_reasoning="Test",
-            long_term_reasoning="Test",
-            confidence_score=0.8,
-        )
-
-        stock = Stock(
-            name="Test",
-            symbol="TEST",
-            price=Decimal("100.00"),
-            change=Decimal("1.00"),
-            change_percentage=Decimal("1.00"),
-            volume=1000,
-            market_cap=Decimal("1000000000"),
-            industry="Test",
-            analysis=analysis,
-            recommendation=recommendation,
-        )
-
-        conditions = MarketConditions(
-            overall_sentiment="neutral",
-            volatility_level="low",
-            sector_performance={},
-            market_movers=[],
-            key_events=[],
-            economic_indicators={},
-            macro_news=[],
-        )
-
         content = EmailContent(
             subject="Daily Stock Picks",
             market_summary="Market is stable today",
-            market_conditions=conditions,
-            top_stocks=[stock] * 10,  # Create 10 identical stocks for testing
+            market_conditions=sample_conditions,
+            top_stocks=[sample_stock] * 10,
         )
 
         assert content.subject == "Daily Stock Picks"
         assert content.market_summary == "Market is stable today"
         assert len(content.top_stocks) == 10
 
-    def test_email_content_validation(self):
+    def test_email_content_validation(self, sample_stock, sample_conditions):
         """Test EmailContent validation."""
-        # Test with less than 10 stocks
-        analysis = StockAnalysis(
-            fundamental_analysis="Test",
-            technical_analysis="Test",
-            news_analysis="Test",
-            analyst_recommendations="Test",
-            analyst_price_targets="Test",
-            sudden_news="Test",
-        )
-
-        recommendation = StockRecommendation(
-            short_term_reasoning="Test",
-            long_term_reasoning="Test",
-            confidence_score=0.8,
-        )
-
-        stock = Stock(
-            name="Test",
-            symbol="TEST",
-            price=Decimal("100.00"),
-            change=Decimal("1.00"),
-            change_percentage=Decimal("1.00"),
-            volume=1000,
-            market_cap=Decimal("1000000000"),
-            industry="Test",
-            analysis=analysis,
-            recommendation=recommendation,
-        )
-
-        conditions = MarketConditions(
-            overall_sentiment="neutral",
-            volatility_level="low",
-            sector_performance={},
-            market_movers=[],
-            key_events=[],
-            economic_indicators={},
-            macro_news=[],
-        )
-
         with pytest.raises(ValueError, match="Must provide exactly 10 top stocks"):
             EmailContent(
                 subject="Test",
                 market_summary="Test",
-                market_conditions=conditions,
-                top_stocks=[stock] * 5,  # Only 5 stocks
+                market_conditions=sample_conditions,
+                top_stocks=[sample_stock] * 5,  # Only 5 stocks
             )
 
-    def test_stock_email_creation(self):
+    def test_stock_email_creation(self, sample_stock, sample_conditions):
         """Test StockEmail model creation."""
-        # Create mock content
-        analysis = StockAnalysis(
-            fundamental_analysis="Test",
-            technical_analysis="Test",
-            news_analysis="Test",
-            analyst_recommendations="Test",
-            analyst_price_targets="Test",
-            sudden_news="Test",
-        )
-
-        recommendation = StockRecommendation(
-            short_term_reasoning="Test",
-            long_term_reasoning="Test",
-            confidence_score=0.8,
-        )
-
-        stock = Stock(
-            name="Test",
-            symbol="TEST",
-            price=Decimal("100.00"),
-            change=Decimal("1.00"),
-            change_percentage=Decimal("1.00"),
-            volume=1000,
-            market_cap=Decimal("1000000000"),
-            industry="Test",
-            analysis=analysis,
-            recommendation=recommendation,
-        )
-
-        conditions = MarketConditions(
-            overall_sentiment="neutral",
-            volatility_level="low",
-            sector_performance={},
-            market_movers=[],
-            key_events=[],
-            economic_indicators={},
-            macro_news=[],
-        )
-
         content = EmailContent(
             subject="Test",
             market_summary="Test",
-            market_conditions=conditions,
-            top_stocks=[stock] * 10,
+            market_conditions=sample_conditions,
+            top_stocks=[sample_stock] * 10,
         )
 
         email = StockEmail(